@@ -2,8 +2,10 @@ package hook
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 
@@ -167,6 +169,11 @@ and logs the usage to the tasker state.`,
 	},
 }
 
+// usageKey marks transcript lines that can carry token usage. Most lines
+// (tool calls, content deltas) never contain it, so they are skipped
+// without being handed to the JSON decoder.
+var usageKey = []byte(`"usage"`)
+
 func parseTranscript(path string) (inputTokens, outputTokens int, err error) {
 	file, err := os.Open(path)
 	if err != nil {
@@ -174,33 +181,88 @@ func parseTranscript(path string) (inputTokens, outputTokens int, err error) {
 	}
 	defer file.Close()
 
-	scanner := bufio.NewScanner(file)
-	// Increase buffer size for potentially large transcript lines
-	buf := make([]byte, 0, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
+	// Map the transcript and walk it in place so lines are never copied.
+	// Fall back to buffered reads when the file can't be mapped.
+	if info, err := file.Stat(); err == nil && info.Size() > 0 && int64(int(info.Size())) == info.Size() {
+		if data, err := mmapFile(file, int(info.Size())); err == nil {
+			defer munmapFile(data)
+			inputTokens, outputTokens = sumTranscriptUsage(data)
+			return inputTokens, outputTokens, nil
+		}
+	}
+	return readTranscript(file)
+}
 
-	for scanner.Scan() {
-		line := scanner.Bytes()
-		if len(line) == 0 {
-			continue
+// sumTranscriptUsage totals token usage over an in-memory transcript.
+func sumTranscriptUsage(data []byte) (inputTokens, outputTokens int) {
+	var entry transcriptEntry
+	for len(data) > 0 {
+		line := data
+		if i := bytes.IndexByte(data, '\n'); i >= 0 {
+			line, data = data[:i], data[i+1:]
+		} else {
+			data = nil
 		}
+		in, out := lineUsage(line, &entry)
+		inputTokens += in
+		outputTokens += out
+	}
+	return inputTokens, outputTokens
+}
 
-		var entry transcriptEntry
-		if err := json.Unmarshal(line, &entry); err != nil {
+func readTranscript(r io.Reader) (inputTokens, outputTokens int, err error) {
+	// Read in 1 MiB slices and split on newlines ourselves; unlike
+	// bufio.Scanner this has no maximum line length.
+	reader := bufio.NewReaderSize(r, 1<<20)
+
+	var entry transcriptEntry
+	var long []byte
+	for {
+		chunk, readErr := reader.ReadSlice('\n')
+		if readErr == bufio.ErrBufferFull {
+			long = append(long, chunk...)
 			continue
 		}
 
-		usage := entry.Usage
-		if usage == nil && entry.Message != nil {
-			usage = entry.Message.Usage
+		line := chunk
+		if len(long) > 0 {
+			long = append(long, chunk...)
+			line = long
 		}
-		if usage != nil {
-			inputTokens += usage.InputTokens
-			outputTokens += usage.OutputTokens
+
+		in, out := lineUsage(line, &entry)
+		inputTokens += in
+		outputTokens += out
+		long = long[:0]
+
+		if readErr == io.EOF {
+			return inputTokens, outputTokens, nil
+		}
+		if readErr != nil {
+			return inputTokens, outputTokens, readErr
 		}
 	}
+}
 
-	return inputTokens, outputTokens, scanner.Err()
+// lineUsage returns the token usage recorded on one transcript line. entry
+// is a decode target reused across lines; it is reset so fields from a
+// previous entry never leak into the next one.
+func lineUsage(line []byte, entry *transcriptEntry) (inputTokens, outputTokens int) {
+	if !bytes.Contains(line, usageKey) {
+		return 0, 0
+	}
+	*entry = transcriptEntry{}
+	if json.Unmarshal(line, entry) != nil {
+		return 0, 0
+	}
+	usage := entry.Usage
+	if usage == nil && entry.Message != nil {
+		usage = entry.Message.Usage
+	}
+	if usage == nil {
+		return 0, 0
+	}
+	return usage.InputTokens, usage.OutputTokens
 }
 
 func findPlanningDir() string {
@@ -0,0 +1,126 @@
+package hook
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func usageLine(in, out string) string {
+	return `{"usage": {"input_tokens": ` + in + `, "output_tokens": ` + out + `}}`
+}
+
+func TestTranscriptUsage(t *testing.T) {
+	// Longer than the 1 MiB read buffer, so readTranscript has to join slices.
+	longText := strings.Repeat("a", 3<<20)
+
+	tests := []struct {
+		name       string
+		content    string
+		wantInput  int
+		wantOutput int
+	}{
+		{
+			name:    "empty",
+			content: "",
+		},
+		{
+			name:       "top-level and message usage",
+			content:    usageLine("100", "50") + "\n" + `{"message": {"usage": {"input_tokens": 200, "output_tokens": 100}}}` + "\n",
+			wantInput:  300,
+			wantOutput: 150,
+		},
+		{
+			name:       "final line without trailing newline",
+			content:    usageLine("100", "50") + "\n" + usageLine("7", "3"),
+			wantInput:  107,
+			wantOutput: 53,
+		},
+		{
+			name:       "lines without usage",
+			content:    `{"type": "tool_use"}` + "\n" + usageLine("10", "5") + "\n" + `{"delta": {"text": "hi"}}` + "\n\n   \n",
+			wantInput:  10,
+			wantOutput: 5,
+		},
+		{
+			name:       "usage only mentioned in text",
+			content:    `{"text": "mentions \"usage\" but has none"}` + "\n" + usageLine("2", "2") + "\n",
+			wantInput:  2,
+			wantOutput: 2,
+		},
+		{
+			name:       "malformed JSON lines",
+			content:    usageLine("100", "50") + "\nnot json\n" + `{"usage": {"input_tokens": 9` + "\n" + usageLine("200", "100") + "\n",
+			wantInput:  300,
+			wantOutput: 150,
+		},
+		{
+			name:       "partial usage fields",
+			content:    `{"usage": {"input_tokens": 100}}` + "\n" + `{"usage": {"output_tokens": 50}}` + "\n",
+			wantInput:  100,
+			wantOutput: 50,
+		},
+		{
+			name:       "line longer than 1 MiB without usage",
+			content:    usageLine("7", "3") + "\r\n" + `{"text": "` + longText + `"}` + "\n" + usageLine("1", "1") + "\n",
+			wantInput:  8,
+			wantOutput: 4,
+		},
+		{
+			name:       "line longer than 1 MiB with usage",
+			content:    `{"text": "` + longText + `", "usage": {"input_tokens": 40, "output_tokens": 2}}` + "\n" + usageLine("1", "1"),
+			wantInput:  41,
+			wantOutput: 3,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			path := filepath.Join(t.TempDir(), "transcript.jsonl")
+			if err := os.WriteFile(path, []byte(tt.content), 0644); err != nil {
+				t.Fatalf("failed to write transcript: %v", err)
+			}
+
+			// parseTranscript maps the file where it can; the other two are
+			// the in-memory walk and the buffered fallback on their own.
+			input, output, err := parseTranscript(path)
+			if err != nil {
+				t.Fatalf("parseTranscript failed: %v", err)
+			}
+			if input != tt.wantInput || output != tt.wantOutput {
+				t.Errorf("parseTranscript = (%d, %d), want (%d, %d)", input, output, tt.wantInput, tt.wantOutput)
+			}
+
+			input, output = sumTranscriptUsage([]byte(tt.content))
+			if input != tt.wantInput || output != tt.wantOutput {
+				t.Errorf("sumTranscriptUsage = (%d, %d), want (%d, %d)", input, output, tt.wantInput, tt.wantOutput)
+			}
+
+			input, output, err = readTranscript(bytes.NewReader([]byte(tt.content)))
+			if err != nil {
+				t.Fatalf("readTranscript failed: %v", err)
+			}
+			if input != tt.wantInput || output != tt.wantOutput {
+				t.Errorf("readTranscript = (%d, %d), want (%d, %d)", input, output, tt.wantInput, tt.wantOutput)
+			}
+		})
+	}
+}
+
+func TestParseTranscript_MissingFile(t *testing.T) {
+	if _, _, err := parseTranscript(filepath.Join(t.TempDir(), "missing.jsonl")); err == nil {
+		t.Error("expected an error for a missing transcript")
+	}
+}
+
+func TestLineUsage_ResetsEntry(t *testing.T) {
+	var entry transcriptEntry
+	lineUsage([]byte(`{"message": {"usage": {"input_tokens": 5, "output_tokens": 5}}}`), &entry)
+
+	input, output := lineUsage([]byte(`{"usage": null, "note": "no usage here"}`), &entry)
+	if input != 0 || output != 0 {
+		t.Errorf("lineUsage = (%d, %d), want (0, 0): previous entry leaked", input, output)
+	}
+}
@@ -0,0 +1,16 @@
+//go:build !unix
+
+package hook
+
+import (
+	"errors"
+	"os"
+)
+
+func mmapFile(f *os.File, size int) ([]byte, error) {
+	return nil, errors.New("mmap not supported on this platform")
+}
+
+func munmapFile(data []byte) error {
+	return nil
+}
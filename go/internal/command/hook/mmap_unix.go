@@ -0,0 +1,17 @@
+//go:build unix
+
+package hook
+
+import (
+	"os"
+	"syscall"
+)
+
+// mmapFile maps size bytes of f read-only into memory.
+func mmapFile(f *os.File, size int) ([]byte, error) {
+	return syscall.Mmap(int(f.Fd()), 0, size, syscall.PROT_READ, syscall.MAP_SHARED)
+}
+
+func munmapFile(data []byte) error {
+	return syscall.Munmap(data)
+}
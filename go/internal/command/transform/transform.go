@@ -1,29 +1,32 @@
 package transform
 
 import (
+	"bufio"
+	"bytes"
+	"crypto/sha256"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
-	"regexp"
 	"runtime"
 	"sort"
 	"strings"
 	"sync"
+	"unicode"
 
 	"github.com/dgordon/tasker/internal/command"
+	"github.com/dgordon/tasker/internal/config"
 	"github.com/spf13/cobra"
 )
 
 var (
 	targetDir string
 
-	pathSplitter  = regexp.MustCompile(`[/_.]`)
-	sectionHeader = regexp.MustCompile(`^#{1,3}\s`)
-
-	cachedSpec     string
+	cachedSections []specSection
 	cachedCapMap   *CapabilityMap
+	cachedCapIndex *capabilityIndex
 	cachedState    *State
 	sharedDataOnce sync.Once
 	sharedDataErr  error
@@ -158,16 +161,30 @@ type ManifestEntry struct {
 	Dependencies []string `json:"dependencies"`
 }
 
+// batchMapping is the task-to-beads-mapping.json written by batch-create.
+// Target records which directory's beads database the issues were created
+// in, so a mapping is only reused against that same database. Linked lists
+// the dependency edges already added there.
+type batchMapping struct {
+	Target string            `json:"target"`
+	Issues map[string]string `json:"issues"`
+	Linked []depEdge         `json:"linked"`
+}
+
+// depEdge is a dependency of task From on task To.
+type depEdge struct {
+	From string `json:"from"`
+	To   string `json:"to"`
+}
+
 type issueResult struct {
 	taskID  string
 	beadsID string
-	deps    []string
 	err     error
 }
 
 type depLinkResult struct {
-	from    string
-	to      string
+	edge    depEdge
 	success bool
 }
 
@@ -228,7 +245,9 @@ var batchCreateCmd = &cobra.Command{
 Phase 1: Creates all issues concurrently
 Phase 2: Links dependencies between issues
 
-Outputs task-to-beads-mapping.json with the mapping of task IDs to beads IDs.`,
+Outputs task-to-beads-mapping.json with the target directory and the mapping
+of task IDs to beads IDs. Re-running against the same target skips tasks
+already in the mapping.`,
 	Args: cobra.ExactArgs(1),
 	RunE: runBatchCreate,
 }
@@ -312,7 +331,13 @@ func loadSharedData() error {
 		go func() {
 			defer wg.Done()
 			data, _ := os.ReadFile(filepath.Join(getInputsDir(), "spec.md"))
-			cachedSpec = string(data)
+			// The spec is invariant for the run, so split and lowercase it
+			// once here rather than once per task.
+			sections := splitSpecIntoSections(string(data))
+			cachedSections = make([]specSection, len(sections))
+			for i, section := range sections {
+				cachedSections[i] = specSection{text: section, lower: strings.ToLower(section)}
+			}
 		}()
 
 		go func() {
@@ -323,6 +348,7 @@ func loadSharedData() error {
 			} else {
 				cachedCapMap = cm
 			}
+			cachedCapIndex = newCapabilityIndex(cachedCapMap)
 		}()
 
 		go func() {
@@ -401,52 +427,101 @@ func getAllTaskIDs() ([]string, error) {
 	return ids, nil
 }
 
-func findCapabilityContext(capMap *CapabilityMap, task *Task) CapabilityContext {
-	result := CapabilityContext{}
+// capabilityIndex maps domain and capability names and IDs to their
+// position in a CapabilityMap, so matching a task is a few map lookups
+// instead of a scan of every domain and capability.
+type capabilityIndex struct {
+	domainByName map[string]int
+	domainByID   map[string]int
+	capByName    []map[string]int
+	capByID      []map[string]int
+}
 
+func newCapabilityIndex(capMap *CapabilityMap) *capabilityIndex {
+	idx := &capabilityIndex{
+		domainByName: make(map[string]int, len(capMap.Domains)),
+		domainByID:   make(map[string]int, len(capMap.Domains)),
+		capByName:    make([]map[string]int, len(capMap.Domains)),
+		capByID:      make([]map[string]int, len(capMap.Domains)),
+	}
 	for i := range capMap.Domains {
 		domain := &capMap.Domains[i]
-		if domain.Name != task.Context.Domain && domain.ID != task.Context.DomainID {
-			continue
-		}
+		addFirst(idx.domainByName, domain.Name, i)
+		addFirst(idx.domainByID, domain.ID, i)
 
-		result.Domain = &DomainInfo{
-			Name:        domain.Name,
-			Description: domain.Description,
+		idx.capByName[i] = make(map[string]int, len(domain.Capabilities))
+		idx.capByID[i] = make(map[string]int, len(domain.Capabilities))
+		for j := range domain.Capabilities {
+			addFirst(idx.capByName[i], domain.Capabilities[j].Name, j)
+			addFirst(idx.capByID[i], domain.Capabilities[j].ID, j)
 		}
+	}
+	return idx
+}
 
-		for j := range domain.Capabilities {
-			cap := &domain.Capabilities[j]
-			if cap.Name != task.Context.Capability && cap.ID != task.Context.CapabilityID {
-				continue
-			}
+// addFirst records the position of the first entry with the given key, so
+// lookups resolve to the same entry a front-to-back scan would.
+func addFirst(m map[string]int, key string, pos int) {
+	if _, ok := m[key]; !ok {
+		m[key] = pos
+	}
+}
 
-			result.Capability = &CapabilityInfo{
-				Name:        cap.Name,
-				Description: cap.Description,
-				SpecRef:     cap.SpecRef,
-			}
+// firstMatch returns the earliest position matching either name or id, or
+// -1 if neither is present.
+func firstMatch(byName, byID map[string]int, name, id string) int {
+	pos := -1
+	if i, ok := byName[name]; ok {
+		pos = i
+	}
+	if i, ok := byID[id]; ok && (pos < 0 || i < pos) {
+		pos = i
+	}
+	return pos
+}
 
-			behaviorSet := make(map[string]struct{}, len(task.Behaviors))
-			for _, b := range task.Behaviors {
-				behaviorSet[b] = struct{}{}
-			}
+func findCapabilityContext(capMap *CapabilityMap, idx *capabilityIndex, task *Task) CapabilityContext {
+	result := CapabilityContext{}
 
-			result.Behaviors = make([]BehaviorInfo, 0, len(task.Behaviors))
-			for k := range cap.Behaviors {
-				behavior := &cap.Behaviors[k]
-				if _, ok := behaviorSet[behavior.ID]; ok {
-					result.Behaviors = append(result.Behaviors, BehaviorInfo{
-						ID:          behavior.ID,
-						Name:        behavior.Name,
-						Description: behavior.Description,
-						Type:        behavior.Type,
-					})
-				}
-			}
-			break
+	i := firstMatch(idx.domainByName, idx.domainByID, task.Context.Domain, task.Context.DomainID)
+	if i < 0 {
+		return result
+	}
+	domain := &capMap.Domains[i]
+
+	result.Domain = &DomainInfo{
+		Name:        domain.Name,
+		Description: domain.Description,
+	}
+
+	j := firstMatch(idx.capByName[i], idx.capByID[i], task.Context.Capability, task.Context.CapabilityID)
+	if j < 0 {
+		return result
+	}
+	cap := &domain.Capabilities[j]
+
+	result.Capability = &CapabilityInfo{
+		Name:        cap.Name,
+		Description: cap.Description,
+		SpecRef:     cap.SpecRef,
+	}
+
+	behaviorSet := make(map[string]struct{}, len(task.Behaviors))
+	for _, b := range task.Behaviors {
+		behaviorSet[b] = struct{}{}
+	}
+
+	result.Behaviors = make([]BehaviorInfo, 0, len(task.Behaviors))
+	for k := range cap.Behaviors {
+		behavior := &cap.Behaviors[k]
+		if _, ok := behaviorSet[behavior.ID]; ok {
+			result.Behaviors = append(result.Behaviors, BehaviorInfo{
+				ID:          behavior.ID,
+				Name:        behavior.Name,
+				Description: behavior.Description,
+				Type:        behavior.Type,
+			})
 		}
-		break
 	}
 
 	return result
@@ -457,11 +532,21 @@ var stopwords = map[string]struct{}{
 	"that": {}, "this": {}, "are": {}, "will": {}, "can": {}, "should": {},
 }
 
+func isNotWordRune(r rune) bool {
+	return !unicode.IsLetter(r) && !unicode.IsDigit(r)
+}
+
+func isPathSeparator(r rune) bool {
+	return r == '/' || r == '_' || r == '.'
+}
+
 func extractKeywords(task *Task, capCtx CapabilityContext) map[string]struct{} {
 	keywords := make(map[string]struct{}, 32)
 
+	// Split on anything that is not a letter or digit so punctuation such
+	// as "login," or "(session)" does not end up inside a keyword.
 	addWords := func(s string) {
-		for _, word := range strings.Fields(strings.ToLower(s)) {
+		for _, word := range strings.FieldsFunc(strings.ToLower(s), isNotWordRune) {
 			if _, stop := stopwords[word]; !stop && len(word) > 3 {
 				keywords[word] = struct{}{}
 			}
@@ -477,8 +562,7 @@ func extractKeywords(task *Task, capCtx CapabilityContext) map[string]struct{} {
 	}
 
 	for i := range task.Files {
-		parts := pathSplitter.Split(task.Files[i].Path, -1)
-		for _, p := range parts {
+		for _, p := range strings.FieldsFunc(task.Files[i].Path, isPathSeparator) {
 			if len(p) > 3 {
 				keywords[strings.ToLower(p)] = struct{}{}
 			}
@@ -488,13 +572,37 @@ func extractKeywords(task *Task, capCtx CapabilityContext) map[string]struct{} {
 	return keywords
 }
 
+// specSection pairs a spec section with its lowercased form for keyword
+// matching.
+type specSection struct {
+	text  string
+	lower string
+}
+
+// isSectionHeader reports whether line is a level 1-3 markdown heading,
+// i.e. one to three '#' characters followed by whitespace.
+func isSectionHeader(line string) bool {
+	n := 0
+	for n < len(line) && n < 3 && line[n] == '#' {
+		n++
+	}
+	if n == 0 || n == len(line) {
+		return false
+	}
+	switch line[n] {
+	case ' ', '\t', '\n', '\f', '\r':
+		return true
+	}
+	return false
+}
+
 func splitSpecIntoSections(spec string) []string {
 	lines := strings.Split(spec, "\n")
 	var sections []string
 	var current strings.Builder
 
 	for _, line := range lines {
-		if sectionHeader.MatchString(line) {
+		if isSectionHeader(line) {
 			if current.Len() > 0 {
 				sections = append(sections, current.String())
 				current.Reset()
@@ -511,12 +619,11 @@ func splitSpecIntoSections(spec string) []string {
 	return sections
 }
 
-func extractRelevantSpecSections(spec string, keywords map[string]struct{}) []string {
-	if spec == "" || len(keywords) == 0 {
+func extractRelevantSpecSections(sections []specSection, keywords map[string]struct{}) []string {
+	if len(sections) == 0 || len(keywords) == 0 {
 		return nil
 	}
 
-	sections := splitSpecIntoSections(spec)
 	type scored struct {
 		section string
 		score   int
@@ -524,16 +631,15 @@ func extractRelevantSpecSections(spec string, keywords map[string]struct{}) []st
 	candidates := make([]scored, 0, 8)
 
 	for _, section := range sections {
-		sectionLower := strings.ToLower(section)
 		score := 0
 		for kw := range keywords {
-			if strings.Contains(sectionLower, kw) {
+			if strings.Contains(section.lower, kw) {
 				score++
 			}
 		}
 
 		if score >= 2 {
-			s := strings.TrimSpace(section)
+			s := strings.TrimSpace(section.text)
 			if len(s) > 1500 {
 				s = s[:1500] + "\n[...truncated...]"
 			}
@@ -617,9 +723,9 @@ func prepareTaskContext(taskID string) (*PreparedContext, error) {
 		return nil, err
 	}
 
-	capCtx := findCapabilityContext(cachedCapMap, task)
+	capCtx := findCapabilityContext(cachedCapMap, cachedCapIndex, task)
 	keywords := extractKeywords(task, capCtx)
-	relevantSpec := extractRelevantSpecSections(cachedSpec, keywords)
+	relevantSpec := extractRelevantSpecSections(cachedSections, keywords)
 	depCtx := getDependencyContext(task)
 
 	taskState := cachedState.Tasks[taskID]
@@ -644,6 +750,37 @@ func prepareTaskContext(taskID string) (*PreparedContext, error) {
 	}, nil
 }
 
+// contextResult is the outcome of preparing and saving one task's context.
+type contextResult struct {
+	ctx     *PreparedContext
+	err     error
+	saveErr error
+}
+
+// prepareAndSaveContexts builds and saves the context for every task
+// concurrently, bounded by the number of CPUs. Results are indexed like
+// taskIDs so callers can report them in a deterministic order.
+func prepareAndSaveContexts(taskIDs []string) []contextResult {
+	results := make([]contextResult, len(taskIDs))
+	var wg sync.WaitGroup
+	sem := make(chan struct{}, runtime.NumCPU())
+	for i, id := range taskIDs {
+		wg.Add(1)
+		go func(i int, taskID string) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			r := &results[i]
+			r.ctx, r.err = prepareTaskContext(taskID)
+			if r.err == nil && r.ctx != nil {
+				_, r.saveErr = saveContextForEnrichment(taskID, r.ctx)
+			}
+		}(i, id)
+	}
+	wg.Wait()
+	return results
+}
+
 func saveContextForEnrichment(taskID string, ctx *PreparedContext) (string, error) {
 	beadsExportDir := getBeadsExportDir()
 	if err := os.MkdirAll(beadsExportDir, 0755); err != nil {
@@ -651,12 +788,56 @@ func saveContextForEnrichment(taskID string, ctx *PreparedContext) (string, erro
 	}
 
 	outputPath := filepath.Join(beadsExportDir, taskID+"-context.json")
-	data, err := json.MarshalIndent(ctx, "", "  ")
+
+	// Leave the file alone when it already holds this exact context, so
+	// re-running context --all only rewrites tasks whose inputs changed.
+	digest := sha256.New()
+	if err := encodeContext(digest, ctx); err != nil {
+		return "", err
+	}
+	if existing, err := fileDigest(outputPath); err == nil && bytes.Equal(existing, digest.Sum(nil)) {
+		return outputPath, nil
+	}
+
+	file, err := os.OpenFile(outputPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
 	if err != nil {
 		return "", err
 	}
 
-	return outputPath, os.WriteFile(outputPath, data, 0644)
+	// Encode straight into the file rather than building the whole
+	// indented document in memory first; contexts embed spec sections and
+	// can be large.
+	w := bufio.NewWriter(file)
+	if err := encodeContext(w, ctx); err != nil {
+		file.Close()
+		return "", err
+	}
+	if err := w.Flush(); err != nil {
+		file.Close()
+		return "", err
+	}
+
+	return outputPath, file.Close()
+}
+
+func encodeContext(w io.Writer, ctx *PreparedContext) error {
+	enc := json.NewEncoder(w)
+	enc.SetIndent("", "  ")
+	return enc.Encode(ctx)
+}
+
+func fileDigest(path string) ([]byte, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer file.Close()
+
+	h := sha256.New()
+	if _, err := io.Copy(h, file); err != nil {
+		return nil, err
+	}
+	return h.Sum(nil), nil
 }
 
 func printContextSummary(ctx *PreparedContext) {
@@ -677,22 +858,23 @@ func runContext(cmd *cobra.Command, args []string) error {
 		}
 
 		preloadTasks(taskIDs)
+		results := prepareAndSaveContexts(taskIDs)
 
 		fmt.Printf("Prepared context for %d tasks\n\n", len(taskIDs))
 
-		for _, taskID := range taskIDs {
-			ctx, err := prepareTaskContext(taskID)
-			if err != nil {
-				fmt.Fprintf(os.Stderr, "Warning: %s: %v\n", taskID, err)
+		for i, taskID := range taskIDs {
+			r := results[i]
+			if r.err != nil {
+				fmt.Fprintf(os.Stderr, "Warning: %s: %v\n", taskID, r.err)
 				continue
 			}
-			if ctx == nil {
+			if r.ctx == nil {
 				continue
 			}
 
-			printContextSummary(ctx)
-			if _, err := saveContextForEnrichment(taskID, ctx); err != nil {
-				fmt.Fprintf(os.Stderr, "Warning: failed to save %s: %v\n", taskID, err)
+			printContextSummary(r.ctx)
+			if r.saveErr != nil {
+				fmt.Fprintf(os.Stderr, "Warning: failed to save %s: %v\n", taskID, r.saveErr)
 			}
 			fmt.Println()
 		}
@@ -729,6 +911,21 @@ func runContext(cmd *cobra.Command, args []string) error {
 	return nil
 }
 
+// countBySuffix counts the entries of dir whose names end in each suffix,
+// reading the directory once. A missing directory counts as empty.
+func countBySuffix(dir string, suffixes ...string) []int {
+	counts := make([]int, len(suffixes))
+	entries, _ := os.ReadDir(dir)
+	for _, e := range entries {
+		for i, suffix := range suffixes {
+			if strings.HasSuffix(e.Name(), suffix) {
+				counts[i]++
+			}
+		}
+	}
+	return counts
+}
+
 func runStatus(cmd *cobra.Command, args []string) error {
 	taskIDs, err := getAllTaskIDs()
 	if err != nil {
@@ -748,20 +945,17 @@ func runStatus(cmd *cobra.Command, args []string) error {
 
 	beadsExportDir := getBeadsExportDir()
 	if isDir(beadsExportDir) {
-		exported, _ := filepath.Glob(filepath.Join(beadsExportDir, "*-context.json"))
-		enriched, _ := filepath.Glob(filepath.Join(beadsExportDir, "*-enriched.json"))
+		counts := countBySuffix(beadsExportDir, "-context.json", "-enriched.json")
 		fmt.Printf("\nBeads export directory: %s\n", beadsExportDir)
-		fmt.Printf("  Context files: %d\n", len(exported))
-		fmt.Printf("  Enriched files: %d\n", len(enriched))
+		fmt.Printf("  Context files: %d\n", counts[0])
+		fmt.Printf("  Enriched files: %d\n", counts[1])
 	}
 
 	fmt.Printf("\nTarget Directory: %s\n", target)
 	if isBeadsInitialized(target) {
 		fmt.Println("  Beads: initialized")
 		issuesDir := filepath.Join(target, ".beads", "issues")
-		if issues, err := filepath.Glob(filepath.Join(issuesDir, "*.md")); err == nil {
-			fmt.Printf("  Issues: %d\n", len(issues))
-		}
+		fmt.Printf("  Issues: %d\n", countBySuffix(issuesDir, ".md")[0])
 	} else {
 		fmt.Println("  Beads: not initialized")
 		fmt.Println("  Run 'tasker transform init-target <dir>' to initialize")
@@ -777,7 +971,6 @@ func initBeadsInTarget(target, prefix string) (bool, string) {
 
 	initCmd := exec.Command("bd", "init", prefix)
 	initCmd.Dir = target
-	initCmd.Env = append(os.Environ(), "PWD="+target)
 
 	if output, err := initCmd.CombinedOutput(); err != nil {
 		return false, fmt.Sprintf("Failed to initialize beads: %s", string(output))
@@ -785,7 +978,6 @@ func initBeadsInTarget(target, prefix string) (bool, string) {
 
 	onboardCmd := exec.Command("bd", "onboard")
 	onboardCmd.Dir = target
-	onboardCmd.Env = append(os.Environ(), "PWD="+target)
 
 	if output, err := onboardCmd.CombinedOutput(); err != nil {
 		return false, fmt.Sprintf("Beads initialized but onboarding failed: %s", string(output))
@@ -850,9 +1042,10 @@ func createBeadsIssue(taskID, title, description, priority string, labels []stri
 		cmdArgs = append(cmdArgs, "-d", description)
 	}
 
+	// With Env left nil, exec inherits our environment and sets PWD to Dir
+	// itself, so there is no per-call copy of os.Environ.
 	bdCmd := exec.Command("bd", cmdArgs...)
 	bdCmd.Dir = target
-	bdCmd.Env = append(os.Environ(), "PWD="+target)
 
 	output, err := bdCmd.Output()
 	if err != nil {
@@ -870,14 +1063,31 @@ func createBeadsIssue(taskID, title, description, priority string, labels []stri
 	return true, issueID
 }
 
-func createIssuesParallel(entries []ManifestEntry, workers int) (map[string]string, map[string][]string, int, int) {
+// entryDependencies returns the task IDs an entry depends on, preferring
+// the manifest's own list and falling back to the task file when the
+// manifest doesn't carry one.
+func entryDependencies(entry ManifestEntry) []string {
+	if entry.Dependencies != nil {
+		return entry.Dependencies
+	}
+	task, _ := loadTask(entry.TaskID)
+	if task == nil {
+		return nil
+	}
+	return task.Dependencies.Tasks
+}
+
+// createIssuesParallel creates a beads issue per entry and records each one
+// in mapping as it lands. The mapping is saved to mappingFile every
+// mappingSaveInterval issues so an interrupted run can resume.
+func createIssuesParallel(entries []ManifestEntry, mapping *batchMapping, mappingFile string, workers int) (int, int) {
 	target := getTargetDir()
 
 	if !isBeadsInitialized(target) {
 		success, msg := initBeadsInTarget(target, "TASK")
 		if !success {
 			fmt.Printf("  %s\n", msg)
-			return nil, nil, 0, len(entries)
+			return 0, len(entries)
 		}
 		fmt.Printf("  %s\n", msg)
 	}
@@ -902,10 +1112,6 @@ func createIssuesParallel(entries []ManifestEntry, workers int) (map[string]stri
 				ir := issueResult{taskID: entry.TaskID}
 				if success {
 					ir.beadsID = result
-					task, _ := loadTask(entry.TaskID)
-					if task != nil && len(task.Dependencies.Tasks) > 0 {
-						ir.deps = task.Dependencies.Tasks
-					}
 				} else {
 					ir.err = fmt.Errorf("%s", result)
 				}
@@ -924,8 +1130,6 @@ func createIssuesParallel(entries []ManifestEntry, workers int) (map[string]stri
 		close(results)
 	}()
 
-	taskToBeads := make(map[string]string, len(entries))
-	taskDeps := make(map[string][]string)
 	created, failed := 0, 0
 
 	for r := range results {
@@ -934,73 +1138,154 @@ func createIssuesParallel(entries []ManifestEntry, workers int) (map[string]stri
 			failed++
 		} else {
 			fmt.Printf("  Created: %s -> %s\n", r.taskID, r.beadsID)
-			taskToBeads[r.taskID] = r.beadsID
-			if len(r.deps) > 0 {
-				taskDeps[r.taskID] = r.deps
-			}
+			mapping.Issues[r.taskID] = r.beadsID
 			created++
+			if created%mappingSaveInterval == 0 {
+				if err := saveMapping(mappingFile, mapping); err != nil {
+					fmt.Fprintf(os.Stderr, "Warning: failed to save mapping: %v\n", err)
+				}
+			}
 		}
 	}
 
-	return taskToBeads, taskDeps, created, failed
+	return created, failed
 }
 
-func linkDependenciesParallel(taskToBeads map[string]string, taskDeps map[string][]string, workers int) (int, int) {
-	target := getTargetDir()
-	env := append(os.Environ(), "PWD="+target)
+// mappingSaveInterval is how many new issues or dependency links
+// batch-create adds between checkpoints of the task-to-beads mapping.
+const mappingSaveInterval = 10
+
+// saveMapping writes the mapping through a temp file and rename, so a run
+// killed mid-save leaves the previous mapping intact rather than a
+// truncated one that the next run would have to discard.
+func saveMapping(path string, mapping *batchMapping) error {
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+		return err
+	}
+	data, err := json.MarshalIndent(mapping, "", "  ")
+	if err != nil {
+		return err
+	}
+
+	tmpFile := path + ".tmp"
+	if err := os.WriteFile(tmpFile, data, 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(tmpFile, path); err != nil {
+		os.Remove(tmpFile)
+		return err
+	}
+	return nil
+}
+
+// loadMapping returns the mapping saved by an earlier batch-create against
+// target, or an empty one. A mapping written for another target, or whose
+// issues are no longer in the target's beads database (for example after
+// .beads was reset), is ignored so its tasks are created again.
+func loadMapping(path, target string) *batchMapping {
+	fresh := &batchMapping{Target: target, Issues: make(map[string]string)}
+
+	existing, err := loadJSON[batchMapping](path)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: ignoring unreadable mapping %s: %v\n", path, err)
+		return fresh
+	}
+	if existing == nil || len(existing.Issues) == 0 {
+		return fresh
+	}
+	if existing.Target != target {
+		fmt.Printf("Ignoring %s: it was written for target %q\n", path, existing.Target)
+		return fresh
+	}
 
-	type depJob struct {
-		taskID     string
-		beadsID    string
-		depTaskID  string
-		depBeadsID string
+	// One recorded issue is enough to tell whether the database is the one
+	// the mapping was written against.
+	var probe string
+	for taskID := range existing.Issues {
+		if probe == "" || taskID < probe {
+			probe = taskID
+		}
+	}
+	if !beadsIssueExists(target, existing.Issues[probe]) {
+		fmt.Printf("Ignoring %s: issue %s is not in the beads database at %s\n", path, existing.Issues[probe], target)
+		return fresh
 	}
 
-	var jobs []depJob
-	for taskID, depTaskIDs := range taskDeps {
-		beadsID, ok := taskToBeads[taskID]
-		if !ok {
+	return existing
+}
+
+func beadsIssueExists(target, beadsID string) bool {
+	if !isBeadsInitialized(target) {
+		return false
+	}
+	bdCmd := exec.Command("bd", "show", beadsID)
+	bdCmd.Dir = target
+	return bdCmd.Run() == nil
+}
+
+// pendingEdges returns the dependency edges between issues in mapping that
+// have not been linked yet, in manifest order. Edges a previous run never
+// reached, or failed to link, are picked up again here.
+func pendingEdges(entries []ManifestEntry, mapping *batchMapping) []depEdge {
+	seen := make(map[depEdge]struct{}, len(mapping.Linked))
+	for _, edge := range mapping.Linked {
+		seen[edge] = struct{}{}
+	}
+
+	var edges []depEdge
+	for _, entry := range entries {
+		if _, ok := mapping.Issues[entry.TaskID]; !ok {
 			continue
 		}
-		for _, depTaskID := range depTaskIDs {
-			depBeadsID, ok := taskToBeads[depTaskID]
-			if !ok {
-				fmt.Printf("  Warning: Dependency %s not found for %s\n", depTaskID, taskID)
+		for _, depTaskID := range entryDependencies(entry) {
+			if _, ok := mapping.Issues[depTaskID]; !ok {
+				fmt.Printf("  Warning: Dependency %s not found for %s\n", depTaskID, entry.TaskID)
 				continue
 			}
-			jobs = append(jobs, depJob{taskID, beadsID, depTaskID, depBeadsID})
+			edge := depEdge{From: entry.TaskID, To: depTaskID}
+			if _, ok := seen[edge]; ok {
+				continue
+			}
+			seen[edge] = struct{}{}
+			edges = append(edges, edge)
 		}
 	}
+	return edges
+}
+
+// linkDependenciesParallel adds each edge with 'bd dep add' and records it
+// in mapping.Linked. Like issue creation, the mapping is saved every
+// mappingSaveInterval links; the caller saves it once more at the end.
+func linkDependenciesParallel(edges []depEdge, mapping *batchMapping, mappingFile string, workers int) (int, int) {
+	target := getTargetDir()
 
-	if len(jobs) == 0 {
+	if len(edges) == 0 {
 		return 0, 0
 	}
 
-	jobCh := make(chan depJob, len(jobs))
-	results := make(chan depLinkResult, len(jobs))
+	jobCh := make(chan depEdge, len(edges))
+	results := make(chan depLinkResult, len(edges))
 
 	var wg sync.WaitGroup
 	for w := 0; w < workers; w++ {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
-			for job := range jobCh {
-				bdCmd := exec.Command("bd", "dep", "add", job.beadsID, job.depBeadsID, "-t", "blocks")
+			for edge := range jobCh {
+				bdCmd := exec.Command("bd", "dep", "add", mapping.Issues[edge.From], mapping.Issues[edge.To], "-t", "blocks")
 				bdCmd.Dir = target
-				bdCmd.Env = env
 
 				_, err := bdCmd.CombinedOutput()
 				results <- depLinkResult{
-					from:    job.taskID,
-					to:      job.depTaskID,
+					edge:    edge,
 					success: err == nil,
 				}
 			}
 		}()
 	}
 
-	for _, job := range jobs {
-		jobCh <- job
+	for _, edge := range edges {
+		jobCh <- edge
 	}
 	close(jobCh)
 
@@ -1012,9 +1297,15 @@ func linkDependenciesParallel(taskToBeads map[string]string, taskDeps map[string
 	successCount, failCount := 0, 0
 	for r := range results {
 		if r.success {
+			mapping.Linked = append(mapping.Linked, r.edge)
 			successCount++
+			if successCount%mappingSaveInterval == 0 {
+				if err := saveMapping(mappingFile, mapping); err != nil {
+					fmt.Fprintf(os.Stderr, "Warning: failed to save mapping: %v\n", err)
+				}
+			}
 		} else {
-			fmt.Printf("  Failed to link %s -> %s\n", r.from, r.to)
+			fmt.Printf("  Failed to link %s -> %s\n", r.edge.From, r.edge.To)
 			failCount++
 		}
 	}
@@ -1069,34 +1360,60 @@ func runBatchCreate(cmd *cobra.Command, args []string) error {
 	target := getTargetDir()
 	fmt.Printf("Creating issues in: %s\n", target)
 
+	// bd serializes writes to its own database, so more workers than this
+	// rarely help; TASKER_BD_WORKERS overrides it (1 runs bd serially).
 	workers := runtime.NumCPU()
 	if workers > 8 {
 		workers = 8
 	}
+	workers = config.GetEnvInt(config.EnvBdWorkers, workers)
+	if workers < 1 {
+		workers = 1
+	}
+
+	beadsExportDir := getBeadsExportDir()
+	mappingFile := filepath.Join(beadsExportDir, "task-to-beads-mapping.json")
+
+	// Resume from a previous run: issues already in the mapping were created
+	// and must not be created again.
+	mapping := loadMapping(mappingFile, target)
 
-	taskIDs := make([]string, len(manifest.Issues))
-	for i, entry := range manifest.Issues {
-		taskIDs[i] = entry.TaskID
+	fmt.Println("\n--- Phase 1: Creating issues ---")
+	var pending, skipped []ManifestEntry
+	for _, entry := range manifest.Issues {
+		if beadsID, ok := mapping.Issues[entry.TaskID]; ok {
+			fmt.Printf("  Skipping %s: already created as %s\n", entry.TaskID, beadsID)
+			skipped = append(skipped, entry)
+		} else {
+			pending = append(pending, entry)
+		}
+	}
+
+	// Only entries without a dependency list need their task file read.
+	var taskIDs []string
+	for _, entry := range manifest.Issues {
+		if entry.Dependencies == nil {
+			taskIDs = append(taskIDs, entry.TaskID)
+		}
 	}
 	preloadTasks(taskIDs)
 
-	fmt.Println("\n--- Phase 1: Creating issues ---")
-	taskToBeads, taskDeps, created, failed := createIssuesParallel(manifest.Issues, workers)
+	created, failed := 0, 0
+	if len(pending) > 0 {
+		created, failed = createIssuesParallel(pending, mapping, mappingFile, workers)
+	}
 
-	fmt.Printf("\nPhase 1 complete: %d created, %d failed\n", created, failed)
+	fmt.Printf("\nPhase 1 complete: %d created, %d failed, %d skipped\n", created, failed, len(skipped))
 
-	if len(taskDeps) > 0 {
+	if edges := pendingEdges(manifest.Issues, mapping); len(edges) > 0 {
 		fmt.Println("\n--- Phase 2: Linking dependencies ---")
-		depSuccess, depFailed := linkDependenciesParallel(taskToBeads, taskDeps, workers)
+		depSuccess, depFailed := linkDependenciesParallel(edges, mapping, mappingFile, workers)
 		fmt.Printf("\nPhase 2 complete: %d links created, %d failed\n", depSuccess, depFailed)
 	} else {
 		fmt.Println("\nNo dependencies to link.")
 	}
 
-	beadsExportDir := getBeadsExportDir()
-	mappingFile := filepath.Join(beadsExportDir, "task-to-beads-mapping.json")
-	mappingData, _ := json.MarshalIndent(taskToBeads, "", "  ")
-	if err := os.WriteFile(mappingFile, mappingData, 0644); err != nil {
+	if err := saveMapping(mappingFile, mapping); err != nil {
 		fmt.Fprintf(os.Stderr, "Warning: failed to save mapping: %v\n", err)
 	} else {
 		fmt.Printf("\nMapping saved to: %s\n", mappingFile)
@@ -0,0 +1,649 @@
+package transform
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"reflect"
+	"runtime"
+	"sort"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/dgordon/tasker/internal/command"
+	"github.com/dgordon/tasker/internal/config"
+)
+
+// fakeBd stands in for the beads CLI. Issues are files under .beads so
+// 'bd show' can tell whether the database still holds them, and every call
+// is appended to $BD_LOG.
+const fakeBd = `#!/bin/sh
+echo "$@" >> "$BD_LOG"
+case "$1" in
+  init)
+    [ -n "$BD_FAIL_INIT" ] && { echo "init failed" >&2; exit 1; }
+    mkdir -p .beads ;;
+  create)
+    n=$(ls .beads | wc -l | tr -d ' ')
+    touch ".beads/issue-TASK-$n"
+    echo "TASK-$n" ;;
+  show)
+    [ -f ".beads/issue-$2" ] || exit 1 ;;
+  dep)
+    [ -n "$BD_FAIL_DEP" ] && exit 1 ;;
+esac
+exit 0
+`
+
+type batchEnv struct {
+	target      string
+	mappingFile string
+	manifest    string
+	bdLog       string
+}
+
+// usePlanningDir points the planning-dir flag at a fresh temp directory for
+// the duration of the test.
+func usePlanningDir(t *testing.T) string {
+	t.Helper()
+	planning := t.TempDir()
+	if err := command.RootCmd.PersistentFlags().Set("planning-dir", planning); err != nil {
+		t.Fatalf("failed to set planning dir: %v", err)
+	}
+	t.Cleanup(func() { command.RootCmd.PersistentFlags().Set("planning-dir", ".tasker") })
+	return planning
+}
+
+func setupBatchCreate(t *testing.T, issues []ManifestEntry) *batchEnv {
+	t.Helper()
+	if runtime.GOOS == "windows" {
+		t.Skip("fake bd is a shell script")
+	}
+
+	planning := usePlanningDir(t)
+
+	target := t.TempDir()
+	if err := os.MkdirAll(filepath.Join(target, ".beads"), 0755); err != nil {
+		t.Fatalf("failed to create .beads: %v", err)
+	}
+	targetDir = target
+	t.Cleanup(func() { targetDir = "" })
+
+	bin := t.TempDir()
+	if err := os.WriteFile(filepath.Join(bin, "bd"), []byte(fakeBd), 0755); err != nil {
+		t.Fatalf("failed to write fake bd: %v", err)
+	}
+	env := &batchEnv{
+		target:      target,
+		mappingFile: filepath.Join(planning, "beads-export", "task-to-beads-mapping.json"),
+		manifest:    filepath.Join(planning, "manifest.json"),
+		bdLog:       filepath.Join(bin, "bd.log"),
+	}
+	t.Setenv("PATH", bin+string(os.PathListSeparator)+os.Getenv("PATH"))
+	t.Setenv("BD_LOG", env.bdLog)
+	t.Setenv(config.EnvBdWorkers, "1")
+
+	data, _ := json.Marshal(BatchManifest{Issues: issues})
+	if err := os.WriteFile(env.manifest, data, 0644); err != nil {
+		t.Fatalf("failed to write manifest: %v", err)
+	}
+	return env
+}
+
+// addIssue records an issue in the fake beads database.
+func (e *batchEnv) addIssue(t *testing.T, beadsID string) {
+	t.Helper()
+	if err := os.WriteFile(filepath.Join(e.target, ".beads", "issue-"+beadsID), nil, 0644); err != nil {
+		t.Fatalf("failed to add issue: %v", err)
+	}
+}
+
+func (e *batchEnv) writeMapping(t *testing.T, mapping batchMapping) {
+	t.Helper()
+	if err := saveMapping(e.mappingFile, &mapping); err != nil {
+		t.Fatalf("failed to write mapping: %v", err)
+	}
+}
+
+func (e *batchEnv) readMapping(t *testing.T) batchMapping {
+	t.Helper()
+	data, err := os.ReadFile(e.mappingFile)
+	if err != nil {
+		t.Fatalf("failed to read mapping: %v", err)
+	}
+	var mapping batchMapping
+	if err := json.Unmarshal(data, &mapping); err != nil {
+		t.Fatalf("failed to parse mapping: %v", err)
+	}
+	return mapping
+}
+
+func (e *batchEnv) run(t *testing.T) {
+	t.Helper()
+	os.Remove(e.bdLog)
+	if err := runBatchCreate(nil, []string{e.manifest}); err != nil {
+		t.Fatalf("runBatchCreate failed: %v", err)
+	}
+}
+
+// calls returns the bd invocations of the last run that start with prefix.
+func (e *batchEnv) calls(t *testing.T, prefix string) []string {
+	t.Helper()
+	data, err := os.ReadFile(e.bdLog)
+	if err != nil && !os.IsNotExist(err) {
+		t.Fatalf("failed to read bd log: %v", err)
+	}
+	var matched []string
+	for _, line := range strings.Split(strings.TrimSpace(string(data)), "\n") {
+		if strings.HasPrefix(line, prefix) {
+			matched = append(matched, line)
+		}
+	}
+	return matched
+}
+
+var twoTasks = []ManifestEntry{
+	{TaskID: "T001", Title: "First", Dependencies: []string{}},
+	{TaskID: "T002", Title: "Second", Dependencies: []string{"T001"}},
+}
+
+func TestBatchCreate_SkipsMappedEntries(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+	env.addIssue(t, "OLD-1")
+	env.writeMapping(t, batchMapping{Target: env.target, Issues: map[string]string{"T001": "OLD-1"}})
+
+	env.run(t)
+
+	creates := env.calls(t, "create ")
+	if len(creates) != 1 || !strings.HasPrefix(creates[0], "create Second ") {
+		t.Fatalf("expected only T002 to be created, got %v", creates)
+	}
+
+	mapping := env.readMapping(t)
+	if mapping.Issues["T001"] != "OLD-1" || mapping.Issues["T002"] == "" {
+		t.Errorf("unexpected issues in mapping: %v", mapping.Issues)
+	}
+
+	deps := env.calls(t, "dep add ")
+	want := "dep add " + mapping.Issues["T002"] + " OLD-1 -t blocks"
+	if len(deps) != 1 || deps[0] != want {
+		t.Errorf("expected %q, got %v", want, deps)
+	}
+	if len(mapping.Linked) != 1 || mapping.Linked[0] != (depEdge{From: "T002", To: "T001"}) {
+		t.Errorf("expected T002 -> T001 recorded as linked, got %v", mapping.Linked)
+	}
+}
+
+func TestBatchCreate_RelinksEdgesBetweenMappedIssues(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+	env.addIssue(t, "OLD-1")
+	env.addIssue(t, "OLD-2")
+	// As left by a run interrupted after its issues were checkpointed but
+	// before phase 2 linked anything.
+	env.writeMapping(t, batchMapping{
+		Target: env.target,
+		Issues: map[string]string{"T001": "OLD-1", "T002": "OLD-2"},
+	})
+
+	env.run(t)
+
+	if creates := env.calls(t, "create "); len(creates) != 0 {
+		t.Errorf("expected no issues created, got %v", creates)
+	}
+	if deps := env.calls(t, "dep add "); len(deps) != 1 || deps[0] != "dep add OLD-2 OLD-1 -t blocks" {
+		t.Errorf("expected the T002 -> T001 edge to be linked, got %v", deps)
+	}
+
+	env.run(t)
+
+	if deps := env.calls(t, "dep add "); len(deps) != 0 {
+		t.Errorf("expected linked edges not to be added again, got %v", deps)
+	}
+}
+
+func TestBatchCreate_RetriesFailedLinks(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+
+	t.Setenv("BD_FAIL_DEP", "1")
+	env.run(t)
+
+	if mapping := env.readMapping(t); len(mapping.Linked) != 0 {
+		t.Fatalf("expected failed link not to be recorded, got %v", mapping.Linked)
+	}
+
+	t.Setenv("BD_FAIL_DEP", "")
+	env.run(t)
+
+	if creates := env.calls(t, "create "); len(creates) != 0 {
+		t.Errorf("expected no issues created on retry, got %v", creates)
+	}
+	if deps := env.calls(t, "dep add "); len(deps) != 1 {
+		t.Errorf("expected the failed link to be retried once, got %v", deps)
+	}
+	if mapping := env.readMapping(t); len(mapping.Linked) != 1 {
+		t.Errorf("expected retried link to be recorded, got %v", mapping.Linked)
+	}
+}
+
+func TestBatchCreate_IgnoresMappingForOtherTarget(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+	env.addIssue(t, "OLD-1")
+	env.writeMapping(t, batchMapping{Target: t.TempDir(), Issues: map[string]string{"T001": "OLD-1"}})
+
+	env.run(t)
+
+	if creates := env.calls(t, "create "); len(creates) != 2 {
+		t.Errorf("expected both issues created, got %v", creates)
+	}
+	if mapping := env.readMapping(t); mapping.Target != env.target {
+		t.Errorf("expected mapping target %s, got %s", env.target, mapping.Target)
+	}
+}
+
+func TestBatchCreate_IgnoresMappingAfterBeadsReset(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+	// OLD-1 is not in the target's beads database.
+	env.writeMapping(t, batchMapping{Target: env.target, Issues: map[string]string{"T001": "OLD-1"}})
+
+	env.run(t)
+
+	if creates := env.calls(t, "create "); len(creates) != 2 {
+		t.Errorf("expected both issues created, got %v", creates)
+	}
+	if mapping := env.readMapping(t); mapping.Issues["T001"] == "OLD-1" {
+		t.Errorf("expected T001 to be recreated, got %v", mapping.Issues)
+	}
+}
+
+func TestCreateIssuesParallel_CheckpointsMapping(t *testing.T) {
+	var entries []ManifestEntry
+	for i := 0; i < mappingSaveInterval; i++ {
+		entries = append(entries, ManifestEntry{TaskID: "T" + string(rune('A'+i)), Dependencies: []string{}})
+	}
+	env := setupBatchCreate(t, entries)
+	mapping := &batchMapping{Target: env.target, Issues: make(map[string]string)}
+
+	created, failed := createIssuesParallel(entries, mapping, env.mappingFile, 1)
+
+	if created != mappingSaveInterval || failed != 0 {
+		t.Fatalf("expected %d created, got %d created, %d failed", mappingSaveInterval, created, failed)
+	}
+	if saved := env.readMapping(t); len(saved.Issues) != mappingSaveInterval {
+		t.Errorf("expected checkpoint with %d issues, got %d", mappingSaveInterval, len(saved.Issues))
+	}
+}
+
+func TestLinkDependenciesParallel_CheckpointsMapping(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+	mapping := &batchMapping{Target: env.target, Issues: map[string]string{"T000": "ROOT"}}
+	var edges []depEdge
+	for i := 0; i <= mappingSaveInterval; i++ {
+		taskID := "T" + string(rune('A'+i))
+		mapping.Issues[taskID] = "ISSUE-" + taskID
+		edges = append(edges, depEdge{From: taskID, To: "T000"})
+	}
+
+	linked, failed := linkDependenciesParallel(edges, mapping, env.mappingFile, 1)
+
+	if linked != len(edges) || failed != 0 {
+		t.Fatalf("expected %d linked, got %d linked, %d failed", len(edges), linked, failed)
+	}
+	// One checkpoint after mappingSaveInterval links; the rest is left for
+	// the caller's final save.
+	if saved := env.readMapping(t); len(saved.Linked) != mappingSaveInterval {
+		t.Errorf("expected checkpoint with %d links, got %d", mappingSaveInterval, len(saved.Linked))
+	}
+}
+
+func TestSaveMapping_ReplacesFileAtomically(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "beads-export", "task-to-beads-mapping.json")
+	if err := saveMapping(path, &batchMapping{Target: "/old", Issues: map[string]string{"T001": "OLD-1"}}); err != nil {
+		t.Fatalf("saveMapping failed: %v", err)
+	}
+	if err := saveMapping(path, &batchMapping{Target: "/new", Issues: map[string]string{"T001": "NEW-1"}}); err != nil {
+		t.Fatalf("saveMapping failed: %v", err)
+	}
+
+	saved, err := loadJSON[batchMapping](path)
+	if err != nil || saved == nil {
+		t.Fatalf("failed to load mapping: %v", err)
+	}
+	if saved.Target != "/new" || saved.Issues["T001"] != "NEW-1" {
+		t.Errorf("expected the second mapping, got %+v", saved)
+	}
+	if _, err := os.Stat(path + ".tmp"); !os.IsNotExist(err) {
+		t.Errorf("expected no temp file left behind, got %v", err)
+	}
+}
+
+func TestCreateIssuesParallel_BeadsInitFailure(t *testing.T) {
+	env := setupBatchCreate(t, twoTasks)
+	if err := os.RemoveAll(filepath.Join(env.target, ".beads")); err != nil {
+		t.Fatalf("failed to remove .beads: %v", err)
+	}
+	t.Setenv("BD_FAIL_INIT", "1")
+	mapping := &batchMapping{Target: env.target, Issues: make(map[string]string)}
+
+	created, failed := createIssuesParallel(twoTasks, mapping, env.mappingFile, 1)
+
+	if created != 0 || failed != len(twoTasks) {
+		t.Errorf("expected all entries failed, got %d created, %d failed", created, failed)
+	}
+	if len(mapping.Issues) != 0 {
+		t.Errorf("expected no issues recorded, got %v", mapping.Issues)
+	}
+}
+
+func sortedKeys(m map[string]struct{}) []string {
+	keys := make([]string, 0, len(m))
+	for k := range m {
+		keys = append(keys, k)
+	}
+	sort.Strings(keys)
+	return keys
+}
+
+// Text is split on every rune that is not a letter or digit. The old
+// tokenizer split on whitespace only, so punctuation stayed attached
+// ("login,"), "user_session" and "rate-limit" were single keywords, and
+// stop words followed by punctuation ("this,") got past the filter. The
+// length and stop-word checks now apply to each piece after splitting.
+func TestExtractKeywords(t *testing.T) {
+	tests := []struct {
+		name string
+		task Task
+		want []string
+	}{
+		{
+			name: "punctuation is stripped",
+			task: Task{Name: "Handle login, (session) expiry."},
+			want: []string{"expiry", "handle", "login", "session"},
+		},
+		{
+			name: "underscores split words",
+			task: Task{Name: "refresh user_session_tokens"},
+			want: []string{"refresh", "session", "tokens", "user"},
+		},
+		{
+			name: "hyphens split words",
+			task: Task{Name: "Rate-limit e-mail retries"},
+			want: []string{"limit", "mail", "rate", "retries"},
+		},
+		{
+			name: "short words are dropped after splitting",
+			task: Task{Name: "Add an API key to db_url"},
+			want: []string{},
+		},
+		{
+			name: "stop words are dropped even with punctuation",
+			task: Task{Name: "Parse this, and that; from config"},
+			want: []string{"config", "parse"},
+		},
+		{
+			name: "digits stay in words",
+			task: Task{Name: "Support oauth2 v1.2 tokens"},
+			want: []string{"oauth2", "support", "tokens"},
+		},
+		{
+			name: "context and file paths",
+			task: Task{
+				Name:    "Store",
+				Context: TaskContext{Domain: "Billing", Capability: "Invoice-Export"},
+				Files:   []FileInfo{{Path: "src/billing/invoice_export.py"}},
+			},
+			want: []string{"billing", "export", "invoice", "store"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := sortedKeys(extractKeywords(&tt.task, CapabilityContext{})); !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("extractKeywords = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestExtractKeywords_BehaviorNames(t *testing.T) {
+	capCtx := CapabilityContext{Behaviors: []BehaviorInfo{{ID: "B1", Name: "Validate_Input-Schema"}}}
+
+	got := sortedKeys(extractKeywords(&Task{}, capCtx))
+
+	if want := []string{"input", "schema", "validate"}; !reflect.DeepEqual(got, want) {
+		t.Errorf("extractKeywords = %v, want %v", got, want)
+	}
+}
+
+// isSectionHeader accepts exactly what the `^#{1,3}\s` regexp it replaced
+// accepted.
+func TestIsSectionHeader(t *testing.T) {
+	tests := []struct {
+		line string
+		want bool
+	}{
+		{"# Title", true},
+		{"## Section", true},
+		{"### Subsection", true},
+		{"#\tTabbed", true},
+		{"##\r", true},
+		{"#### Too deep", false},
+		{"#NoSpace", false},
+		{"#", false},
+		{"", false},
+		{" # Indented", false},
+		{"text # not a heading", false},
+	}
+
+	for _, tt := range tests {
+		if got := isSectionHeader(tt.line); got != tt.want {
+			t.Errorf("isSectionHeader(%q) = %v, want %v", tt.line, got, tt.want)
+		}
+	}
+}
+
+func TestSplitSpecIntoSections(t *testing.T) {
+	tests := []struct {
+		name string
+		spec string
+		want []string
+	}{
+		{
+			name: "empty spec",
+			spec: "",
+			want: []string{"\n"},
+		},
+		{
+			name: "preamble before first heading",
+			spec: "intro\n# One\nbody\n## Two\nmore",
+			want: []string{"intro\n", "# One\nbody\n", "## Two\nmore\n"},
+		},
+		{
+			name: "deep headings stay in their section",
+			spec: "# One\n#### Detail\ntext\n### Three",
+			want: []string{"# One\n#### Detail\ntext\n", "### Three\n"},
+		},
+		{
+			name: "hash without space is not a heading",
+			spec: "# One\n#hashtag\n# Two",
+			want: []string{"# One\n#hashtag\n", "# Two\n"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := splitSpecIntoSections(tt.spec); !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("splitSpecIntoSections = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+// findCapabilityContext must resolve to the same entries as the linear scan
+// it replaced: the first domain, then the first capability within it, whose
+// name or ID matches, whichever comes earlier in the map.
+func TestFindCapabilityContext(t *testing.T) {
+	capMap := &CapabilityMap{Domains: []Domain{
+		{ID: "D1", Name: "Auth", Description: "auth", Capabilities: []Capability{
+			{ID: "C1", Name: "Login", Description: "login", Behaviors: []Behavior{
+				{ID: "B1", Name: "Check password"},
+				{ID: "B2", Name: "Lock account"},
+				{ID: "B3", Name: "Issue token"},
+			}},
+			{ID: "C2", Name: "Login", Description: "second login"},
+			{ID: "", Name: "Logout", Description: "logout"},
+		}},
+		{ID: "D2", Name: "Billing", Description: "billing"},
+		{ID: "", Name: "Auth", Description: "second auth"},
+		{ID: "D4", Name: "Reports", Description: "reports"},
+	}}
+	idx := newCapabilityIndex(capMap)
+
+	tests := []struct {
+		name          string
+		context       TaskContext
+		behaviors     []string
+		wantDomain    string
+		wantCap       string
+		wantBehaviors []string
+	}{
+		{
+			name:       "ID match earlier than name match",
+			context:    TaskContext{Domain: "Billing", DomainID: "D1", CapabilityID: "C9"},
+			wantDomain: "auth",
+		},
+		{
+			name:       "name match earlier than ID match",
+			context:    TaskContext{Domain: "Billing", DomainID: "D4"},
+			wantDomain: "billing",
+		},
+		{
+			name:       "duplicate domain name resolves to the first",
+			context:    TaskContext{Domain: "Auth", DomainID: "D9", CapabilityID: "C9"},
+			wantDomain: "auth",
+		},
+		{
+			name:       "empty ID matches a domain without an ID",
+			context:    TaskContext{Domain: "Unknown"},
+			wantDomain: "second auth",
+		},
+		{
+			name:    "no domain match",
+			context: TaskContext{Domain: "Unknown", DomainID: "D9"},
+		},
+		{
+			name:       "duplicate capability name resolves to the first",
+			context:    TaskContext{DomainID: "D1", Capability: "Login", CapabilityID: "C9"},
+			wantDomain: "auth",
+			wantCap:    "login",
+		},
+		{
+			name:       "capability ID earlier than name match",
+			context:    TaskContext{DomainID: "D1", Capability: "Logout", CapabilityID: "C2"},
+			wantDomain: "auth",
+			wantCap:    "second login",
+		},
+		{
+			name:       "empty capability ID matches a capability without an ID",
+			context:    TaskContext{DomainID: "D1", Capability: "Unknown"},
+			wantDomain: "auth",
+			wantCap:    "logout",
+		},
+		{
+			name:       "domain without a capability match",
+			context:    TaskContext{DomainID: "D2", Capability: "Login", CapabilityID: "C1"},
+			wantDomain: "billing",
+		},
+		{
+			name:          "behaviors in capability order",
+			context:       TaskContext{DomainID: "D1", CapabilityID: "C1"},
+			behaviors:     []string{"B3", "B9", "B1"},
+			wantDomain:    "auth",
+			wantCap:       "login",
+			wantBehaviors: []string{"B1", "B3"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			task := &Task{Context: tt.context, Behaviors: tt.behaviors}
+			got := findCapabilityContext(capMap, idx, task)
+
+			var gotDomain, gotCap string
+			if got.Domain != nil {
+				gotDomain = got.Domain.Description
+			}
+			if got.Capability != nil {
+				gotCap = got.Capability.Description
+			}
+			var gotBehaviors []string
+			for _, b := range got.Behaviors {
+				gotBehaviors = append(gotBehaviors, b.ID)
+			}
+
+			if gotDomain != tt.wantDomain || gotCap != tt.wantCap || !reflect.DeepEqual(gotBehaviors, tt.wantBehaviors) {
+				t.Errorf("findCapabilityContext = (%q, %q, %v), want (%q, %q, %v)",
+					gotDomain, gotCap, gotBehaviors, tt.wantDomain, tt.wantCap, tt.wantBehaviors)
+			}
+		})
+	}
+}
+
+func TestSaveContextForEnrichment_SkipsUnchangedContext(t *testing.T) {
+	usePlanningDir(t)
+	ctx := &PreparedContext{TaskID: "T001", Task: &Task{Name: "Login"}}
+
+	path, err := saveContextForEnrichment("T001", ctx)
+	if err != nil {
+		t.Fatalf("saveContextForEnrichment failed: %v", err)
+	}
+	// Backdate the file so a rewrite would show up as a newer mtime.
+	old := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(path, old, old); err != nil {
+		t.Fatalf("failed to backdate context: %v", err)
+	}
+
+	if _, err := saveContextForEnrichment("T001", &PreparedContext{TaskID: "T001", Task: &Task{Name: "Login"}}); err != nil {
+		t.Fatalf("saveContextForEnrichment failed: %v", err)
+	}
+
+	info, err := os.Stat(path)
+	if err != nil {
+		t.Fatalf("failed to stat context: %v", err)
+	}
+	if !info.ModTime().Equal(old) {
+		t.Errorf("expected unchanged context to be left alone, mtime moved from %v to %v", old, info.ModTime())
+	}
+}
+
+func TestSaveContextForEnrichment_RewritesChangedContext(t *testing.T) {
+	usePlanningDir(t)
+
+	path, err := saveContextForEnrichment("T001", &PreparedContext{TaskID: "T001", Task: &Task{Name: "Login"}})
+	if err != nil {
+		t.Fatalf("saveContextForEnrichment failed: %v", err)
+	}
+	old := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(path, old, old); err != nil {
+		t.Fatalf("failed to backdate context: %v", err)
+	}
+
+	if _, err := saveContextForEnrichment("T001", &PreparedContext{TaskID: "T001", Task: &Task{Name: "Logout"}}); err != nil {
+		t.Fatalf("saveContextForEnrichment failed: %v", err)
+	}
+
+	info, err := os.Stat(path)
+	if err != nil {
+		t.Fatalf("failed to stat context: %v", err)
+	}
+	if !info.ModTime().After(old) {
+		t.Errorf("expected changed context to be rewritten, mtime still %v", info.ModTime())
+	}
+	saved, err := loadJSON[PreparedContext](path)
+	if err != nil || saved == nil {
+		t.Fatalf("failed to load context: %v", err)
+	}
+	if saved.Task.Name != "Logout" {
+		t.Errorf("expected rewritten context, got task name %q", saved.Task.Name)
+	}
+}
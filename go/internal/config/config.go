@@ -16,6 +16,7 @@ const (
 	EnvLogLevel    = "TASKER_LOG_LEVEL"
 	EnvSchemaDir   = "TASKER_SCHEMA_DIR"
 	EnvDebug       = "TASKER_DEBUG"
+	EnvBdWorkers   = "TASKER_BD_WORKERS"
 )
 
 const (
@@ -9,7 +9,7 @@ Usage:
     archive.py planning <project_name>      Archive planning artifacts
     archive.py execution <project_name>     Archive execution artifacts
     archive.py list [--project <name>]      List archived sessions
-    archive.py restore <archive_id>         Restore archived session (planning only)
+    archive.py restore <archive_id> [--yes] Restore archived session (planning only)
 
 Archive Structure:
     archive/
@@ -29,25 +29,57 @@ Archive Structure:
                 └── archive-manifest.json
 """
 
+import argparse
 import json
+import os
 import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+# orjson is optional; it reads and writes bytes directly and is much faster
+# on large state, result and manifest files. json.loads accepts bytes too.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 TASKER_DIR = PROJECT_ROOT / ".tasker"
 ARCHIVE_DIR = PROJECT_ROOT / "archive"
 
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def archive_stamps() -> tuple[str, str]:
+    """Generate the archive ID and ISO timestamp from a single clock read."""
+    now = datetime.now(timezone.utc)
+    return now.strftime("%Y%m%d_%H%M%S"), now.isoformat()
+
+
+def load_json(path: Path) -> dict:
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    Results are shared between callers and must not be mutated.
+    """
+    st = path.stat()
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
 
 
-def timestamp_id() -> str:
-    """Generate timestamp-based archive ID."""
-    return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+@lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> dict:
+    return _json_loads(Path(path).read_bytes())
 
 
 def archive_planning(project_name: str) -> Path:
@@ -61,22 +93,31 @@ def archive_planning(project_name: str) -> Path:
         print("Error: No state.json found - nothing to archive", file=sys.stderr)
         sys.exit(1)
 
-    state = json.loads(state_file.read_text())
+    state = load_json(state_file)
+    tasks = state.get("tasks", {})
     current_phase = state.get("phase", {}).get("current", "unknown")
 
     # Create archive directory
-    archive_id = timestamp_id()
+    archive_id, archived_at = archive_stamps()
     archive_path = ARCHIVE_DIR / project_name / "planning" / archive_id
     archive_path.mkdir(parents=True, exist_ok=True)
 
     # Directories to archive
     dirs_to_archive = ["inputs", "artifacts", "tasks", "reports"]
 
+    # The subtrees are independent, so copy them concurrently; report in
+    # the fixed order afterwards so output stays deterministic.
+    with ThreadPoolExecutor(max_workers=len(dirs_to_archive)) as pool:
+        copied_names = list(
+            pool.map(
+                lambda d: _copy_dir_if_nonempty(TASKER_DIR / d, archive_path / d),
+                dirs_to_archive,
+            )
+        )
+
+    contents = dict(zip(dirs_to_archive, copied_names))
     for dir_name in dirs_to_archive:
-        src_dir = TASKER_DIR / dir_name
-        if src_dir.exists() and any(src_dir.iterdir()):
-            dst_dir = archive_path / dir_name
-            shutil.copytree(src_dir, dst_dir)
+        if contents[dir_name]:
             print(f"  Archived: {dir_name}/")
 
     # Copy state.json
@@ -89,27 +130,23 @@ def archive_planning(project_name: str) -> Path:
         "archive_type": "planning",
         "project_name": project_name,
         "archive_id": archive_id,
-        "archived_at": now_iso(),
+        "archived_at": archived_at,
         "source_dir": str(TASKER_DIR),
         "phase_at_archive": current_phase,
         "contents": {
-            "inputs": list((archive_path / "inputs").glob("*")) if (archive_path / "inputs").exists() else [],
-            "artifacts": list((archive_path / "artifacts").glob("*")) if (archive_path / "artifacts").exists() else [],
-            "tasks": list((archive_path / "tasks").glob("*.json")) if (archive_path / "tasks").exists() else [],
-            "reports": list((archive_path / "reports").glob("*")) if (archive_path / "reports").exists() else [],
+            "inputs": contents["inputs"],
+            "artifacts": contents["artifacts"],
+            "tasks": [name for name in contents["tasks"] if name.endswith(".json")],
+            "reports": contents["reports"],
         },
         "task_summary": {
-            "total": len(state.get("tasks", {})),
-            "by_status": _count_by_status(state.get("tasks", {})),
+            "total": len(tasks),
+            "by_status": _count_by_status(tasks),
         },
     }
 
-    # Convert Path objects to strings for JSON serialization
-    for key in manifest["contents"]:
-        manifest["contents"][key] = [str(p.name) for p in manifest["contents"][key]]
-
     manifest_path = archive_path / "archive-manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    manifest_path.write_bytes(_json_dumps(manifest))
     print("  Created: archive-manifest.json")
 
     print(f"\nArchive created: {archive_path}")
@@ -127,7 +164,8 @@ def archive_execution(project_name: str) -> Path:
         print("Error: No state.json found - nothing to archive", file=sys.stderr)
         sys.exit(1)
 
-    state = json.loads(state_file.read_text())
+    state = load_json(state_file)
+    tasks = state.get("tasks", {})
 
     # Check for execution artifacts
     bundles_dir = TASKER_DIR / "bundles"
@@ -141,7 +179,7 @@ def archive_execution(project_name: str) -> Path:
         return None
 
     # Create archive directory
-    archive_id = timestamp_id()
+    archive_id, archived_at = archive_stamps()
     archive_path = ARCHIVE_DIR / project_name / "execution" / archive_id
     archive_path.mkdir(parents=True, exist_ok=True)
 
@@ -157,9 +195,7 @@ def archive_execution(project_name: str) -> Path:
     # Archive logs
     if has_logs:
         dst_logs = archive_path / "logs"
-        dst_logs.mkdir(exist_ok=True)
-        for log_file in logs_dir.glob("*.log"):
-            shutil.copy2(log_file, dst_logs / log_file.name)
+        shutil.copytree(logs_dir, dst_logs, ignore=_ignore_non_logs, dirs_exist_ok=True)
         archived_items.append("logs/")
         print("  Archived: logs/")
 
@@ -171,7 +207,7 @@ def archive_execution(project_name: str) -> Path:
     results = list(bundles_dir.glob("*-result.json")) if has_bundles else []
     task_results = {}
     for result_file in results:
-        result_data = json.loads(result_file.read_text())
+        result_data = load_json(result_file)
         task_id = result_data.get("task_id", result_file.stem.replace("-result", ""))
         task_results[task_id] = {
             "status": result_data.get("status"),
@@ -183,32 +219,50 @@ def archive_execution(project_name: str) -> Path:
         "archive_type": "execution",
         "project_name": project_name,
         "archive_id": archive_id,
-        "archived_at": now_iso(),
+        "archived_at": archived_at,
         "source_dir": str(TASKER_DIR),
         "target_dir": state.get("target_dir", ""),
         "contents": archived_items,
         "execution_summary": {
-            "total_tasks": len(state.get("tasks", {})),
-            "by_status": _count_by_status(state.get("tasks", {})),
+            "total_tasks": len(tasks),
+            "by_status": _count_by_status(tasks),
             "task_results": task_results,
         },
     }
 
     manifest_path = archive_path / "archive-manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    manifest_path.write_bytes(_json_dumps(manifest))
     print("  Created: archive-manifest.json")
 
     print(f"\nArchive created: {archive_path}")
     return archive_path
 
 
+def _copy_dir_if_nonempty(src_dir: Path, dst_dir: Path) -> list[str]:
+    """Copy src_dir to dst_dir if it has any entries.
+
+    Returns the sorted top-level names that were copied, or [] if src_dir
+    is missing or empty, so callers need not re-list the copy.
+    """
+    if not src_dir.exists():
+        return []
+    with os.scandir(src_dir) as it:
+        names = sorted(e.name for e in it)
+    if names:
+        shutil.copytree(src_dir, dst_dir)
+    return names
+
+
+def _ignore_non_logs(directory: str, names: list[str]) -> set[str]:
+    """copytree ignore callback keeping only top-level *.log files."""
+    with os.scandir(directory) as it:
+        keep = {entry.name for entry in it if entry.name.endswith(".log") and not entry.is_dir()}
+    return set(names) - keep
+
+
 def _count_by_status(tasks: dict) -> dict:
     """Count tasks by status."""
-    counts = {}
-    for task in tasks.values():
-        status = task.get("status", "unknown")
-        counts[status] = counts.get(status, 0) + 1
-    return counts
+    return dict(Counter(task.get("status", "unknown") for task in tasks.values()))
 
 
 def list_archives(project_name: str = None) -> None:
@@ -234,13 +288,15 @@ def list_archives(project_name: str = None) -> None:
                 continue
 
             print(f"  {archive_type}/")
-            for archive_dir in sorted(type_dir.iterdir(), reverse=True):
+            with os.scandir(type_dir) as it:
+                archive_dirs = sorted(it, key=lambda e: e.name, reverse=True)
+            for archive_dir in archive_dirs:
                 if not archive_dir.is_dir():
                     continue
 
-                manifest_path = archive_dir / "archive-manifest.json"
+                manifest_path = Path(archive_dir.path) / "archive-manifest.json"
                 if manifest_path.exists():
-                    manifest = json.loads(manifest_path.read_text())
+                    manifest = load_json(manifest_path)
                     archived_at = manifest.get("archived_at", "unknown")
                     phase = manifest.get("phase_at_archive", "")
                     summary = manifest.get("task_summary", manifest.get("execution_summary", {}))
@@ -253,8 +309,11 @@ def list_archives(project_name: str = None) -> None:
                     print(f"    {archive_dir.name}  (no manifest)")
 
 
-def restore_planning(archive_id: str, project_name: str = None) -> None:
-    """Restore planning artifacts from archive."""
+def restore_planning(archive_id: str, project_name: str = None, assume_yes: bool = False) -> None:
+    """Restore planning artifacts from archive.
+
+    With assume_yes, skip the confirmation prompt (for scripts and CI).
+    """
     # Find the archive
     if project_name:
         search_dirs = [ARCHIVE_DIR / project_name / "planning"]
@@ -275,18 +334,22 @@ def restore_planning(archive_id: str, project_name: str = None) -> None:
     # Confirm restore
     print(f"Restoring from: {archive_path}")
     print(f"This will OVERWRITE: {TASKER_DIR}")
-    response = input("Continue? (yes/no): ")
-    if response.lower() != "yes":
-        print("Aborted")
-        return
-
-    # Clear existing planning directory
+    if not assume_yes:
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Aborted")
+            return
+
+    # Clear existing planning directory. Only its contents go: the directory
+    # itself may be a symlink to a shared location, or be held open elsewhere.
     if TASKER_DIR.exists():
-        for item in TASKER_DIR.iterdir():
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
+        with os.scandir(TASKER_DIR) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+    TASKER_DIR.mkdir(parents=True, exist_ok=True)
 
     # Restore directories
     for dir_name in ["inputs", "artifacts", "tasks", "reports"]:
@@ -326,55 +389,63 @@ def clean_planning_dir() -> None:
     print("Cleaned planning directory")
 
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
+def cmd_planning(args: argparse.Namespace) -> None:
+    archive_planning(args.project_name)
+    if args.clean:
+        clean_planning_dir()
 
-    cmd = sys.argv[1]
-
-    if cmd == "planning":
-        if len(sys.argv) < 3:
-            print("Usage: archive.py planning <project_name>")
-            sys.exit(1)
-        project_name = sys.argv[2]
-        archive_planning(project_name)
-
-        # Ask about cleanup
-        if "--clean" in sys.argv:
-            clean_planning_dir()
-
-    elif cmd == "execution":
-        if len(sys.argv) < 3:
-            print("Usage: archive.py execution <project_name>")
-            sys.exit(1)
-        project_name = sys.argv[2]
-        archive_execution(project_name)
-
-    elif cmd == "list":
-        project_name = None
-        if "--project" in sys.argv:
-            idx = sys.argv.index("--project")
-            if idx + 1 < len(sys.argv):
-                project_name = sys.argv[idx + 1]
-        list_archives(project_name)
-
-    elif cmd == "restore":
-        if len(sys.argv) < 3:
-            print("Usage: archive.py restore <archive_id> [--project <name>]")
-            sys.exit(1)
-        archive_id = sys.argv[2]
-        project_name = None
-        if "--project" in sys.argv:
-            idx = sys.argv.index("--project")
-            if idx + 1 < len(sys.argv):
-                project_name = sys.argv[idx + 1]
-        restore_planning(archive_id, project_name)
 
-    else:
-        print(f"Unknown command: {cmd}")
-        print(__doc__)
-        sys.exit(1)
+def cmd_execution(args: argparse.Namespace) -> None:
+    archive_execution(args.project_name)
+
+
+def cmd_list(args: argparse.Namespace) -> None:
+    list_archives(args.project)
+
+
+def cmd_restore(args: argparse.Namespace) -> None:
+    restore_planning(args.archive_id, args.project, args.yes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Archive planning and execution artifacts"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    planning_parser = subparsers.add_parser(
+        "planning",
+        help="Archive planning artifacts"
+    )
+    planning_parser.add_argument("project_name", help="Project name")
+    planning_parser.add_argument("--clean", action="store_true", help="Clean planning directory after archiving")
+    planning_parser.set_defaults(func=cmd_planning)
+
+    execution_parser = subparsers.add_parser(
+        "execution",
+        help="Archive execution artifacts"
+    )
+    execution_parser.add_argument("project_name", help="Project name")
+    execution_parser.set_defaults(func=cmd_execution)
+
+    list_parser = subparsers.add_parser(
+        "list",
+        help="List archived sessions"
+    )
+    list_parser.add_argument("--project", help="Only list archives for this project")
+    list_parser.set_defaults(func=cmd_list)
+
+    restore_parser = subparsers.add_parser(
+        "restore",
+        help="Restore archived session (planning only)"
+    )
+    restore_parser.add_argument("archive_id", help="Archive ID (timestamp)")
+    restore_parser.add_argument("--project", help="Project the archive belongs to")
+    restore_parser.add_argument("-y", "--yes", action="store_true", help="Skip the confirmation prompt")
+    restore_parser.set_defaults(func=cmd_restore)
+
+    args = parser.parse_args()
+    args.func(args)
 
 
 if __name__ == "__main__":
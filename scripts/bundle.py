@@ -17,12 +17,32 @@ Usage:
 import hashlib
 import json
 import os
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+# orjson is optional; it reads and writes bytes directly and is much faster
+# on large capability and physical maps. json.loads accepts bytes too.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 
 # =============================================================================
 # SHIM LAYER - Forward to Go binary if available
@@ -123,6 +143,9 @@ ARTIFACTS_DIR = TASKER_DIR / "artifacts"
 INPUTS_DIR = TASKER_DIR / "inputs"
 SCHEMAS_DIR = PROJECT_ROOT / "schemas"
 
+BUNDLE_SUFFIX = "-bundle.json"
+CHECKSUM_CACHE_FILE = ".integrity-cache.json"
+
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -134,14 +157,68 @@ def file_checksum(path: Path) -> str:
         return ""
     if path.is_dir():
         return "dir:" + hashlib.sha256(str(path).encode()).hexdigest()[:12]
-    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    # file_digest hashes through a fixed buffer instead of loading the file.
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
+
+def cached_file_checksum(path: Path, cache: dict[str, list]) -> str:
+    """file_checksum, reusing a cached result while the file's mtime and size match.
+
+    cache maps absolute paths to [mtime_ns, size, checksum]; newly computed
+    checksums are added to it.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return file_checksum(path)
+    if stat.S_ISDIR(st.st_mode):
+        return file_checksum(path)
+
+    key = str(path.absolute())
+    entry = cache.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    checksum = file_checksum(path)
+    cache[key] = [st.st_mtime_ns, st.st_size, checksum]
+    return checksum
+
+
+def load_checksum_cache() -> dict[str, list]:
+    """Load the integrity checksum cache, or an empty one if missing or unreadable."""
+    try:
+        cache = _json_loads((BUNDLES_DIR / CHECKSUM_CACHE_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_checksum_cache(cache: dict[str, list]) -> None:
+    """Write the integrity checksum cache; failures only cost a rehash next run."""
+    try:
+        BUNDLES_DIR.mkdir(parents=True, exist_ok=True)
+        (BUNDLES_DIR / CHECKSUM_CACHE_FILE).write_bytes(_json_dumps(cache))
+    except OSError:
+        pass
 
 
 def load_json(path: Path) -> dict | None:
-    """Load JSON file, return None if not found."""
-    if not path.exists():
+    """Load JSON file, return None if not found.
+
+    The parsed result is reused while the file is unchanged, so results are
+    shared between callers and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except OSError:
         return None
-    return json.loads(path.read_text())
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> dict:
+    return _json_loads(Path(path).read_bytes())
 
 
 def load_task(task_id: str) -> dict | None:
@@ -150,6 +227,16 @@ def load_task(task_id: str) -> dict | None:
     return load_json(task_path)
 
 
+def artifact_paths(task_id: str) -> dict[str, Path]:
+    """Paths of the planning artifacts whose checksums a task's bundle records."""
+    return {
+        "capability_map": ARTIFACTS_DIR / "capability-map.json",
+        "physical_map": ARTIFACTS_DIR / "physical-map.json",
+        "constraints": INPUTS_DIR / "constraints.md",
+        "task_definition": TASKS_DIR / f"{task_id}.json",
+    }
+
+
 def load_capability_map() -> dict | None:
     """Load capability map artifact."""
     return load_json(ARTIFACTS_DIR / "capability-map.json")
@@ -173,6 +260,45 @@ def load_constraints() -> str | None:
     return None
 
 
+def build_behavior_index(capability_map: dict) -> dict[str, dict]:
+    """Index capability map behaviors by ID, with their domain and capability details."""
+    index: dict[str, dict] = {}
+    for domain in capability_map.get("domains", []):
+        for capability in domain.get("capabilities", []):
+            for behavior in capability.get("behaviors", []):
+                behavior_id = behavior.get("id")
+                if behavior_id not in index:
+                    index[behavior_id] = {
+                        **behavior,
+                        "domain": domain.get("name"),
+                        "domain_id": domain.get("id"),
+                        "capability": capability.get("name"),
+                        "capability_id": capability.get("id"),
+                        "spec_ref": capability.get("spec_ref"),
+                    }
+    return index
+
+
+def build_behavior_files_index(physical_map: dict) -> dict[str, list[dict]]:
+    """Index physical map file and test entries by behavior ID."""
+    index: dict[str, list[dict]] = {}
+    for mapping in physical_map.get("file_mapping", []):
+        behavior_id = mapping.get("behavior_id")
+        files = index.setdefault(behavior_id, [])
+        for file_info in mapping.get("files", []):
+            files.append({
+                **file_info,
+                "behaviors": [behavior_id],
+            })
+        for test_info in mapping.get("tests", []):
+            files.append({
+                **test_info,
+                "layer": "test",
+                "behaviors": [behavior_id],
+            })
+    return index
+
+
 def find_behavior_by_id(capability_map: dict, behavior_id: str) -> dict | None:
     """Find behavior details from capability map by ID."""
     for domain in capability_map.get("domains", []):
@@ -211,10 +337,12 @@ def find_files_for_behavior(physical_map: dict, behavior_id: str) -> list[dict]:
 
 def find_dependencies_files(state: dict, task_deps: list[str]) -> list[str]:
     """Get files created by dependency tasks."""
+    tasks = state.get("tasks") or {}
     files = []
     for dep_id in task_deps:
-        dep_task = state.get("tasks", {}).get(dep_id, {})
-        files.extend(dep_task.get("files_created", []))
+        dep_task = tasks.get(dep_id)
+        if dep_task:
+            files.extend(dep_task.get("files_created", ()))
     return files
 
 
@@ -316,35 +444,68 @@ def parse_constraints(raw_constraints: str | None) -> dict:
     return result
 
 
-def generate_bundle(task_id: str) -> tuple[bool, str, dict | None]:
+def load_bundle_inputs(state: dict | None = None) -> tuple[dict | None, str]:
     """
-    Generate execution bundle for a task.
+    Load and index the planning artifacts shared by every bundle.
 
-    Returns: (success, message, bundle_dict)
-    """
-    task = load_task(task_id)
-    if not task:
-        return False, f"Task not found: {task_id}", None
+    Pass state if the caller has already loaded it.
 
+    Returns: (inputs, error_message) - inputs is None if an artifact is missing
+    """
     capability_map = load_capability_map()
     if not capability_map:
-        return False, "capability-map.json not found", None
+        return None, "capability-map.json not found"
 
     physical_map = load_physical_map()
     if not physical_map:
-        return False, "physical-map.json not found", None
+        return None, "physical-map.json not found"
 
-    state = load_state()
+    if state is None:
+        state = load_state()
     if not state:
-        return False, "state.json not found", None
+        return None, "state.json not found"
+
+    return {
+        "behaviors": build_behavior_index(capability_map),
+        "behavior_files": build_behavior_files_index(physical_map),
+        "state": state,
+        "constraints": parse_constraints(load_constraints()),
+    }, ""
+
+
+def generate_bundle(task_id: str, inputs: dict | None = None) -> tuple[bool, str, dict | None]:
+    """
+    Generate execution bundle for a task.
 
-    raw_constraints = load_constraints()
+    inputs is the result of load_bundle_inputs(); it is loaded here if not
+    given, so callers generating many bundles should load it once and pass it.
+    Dependency files are only hashed concurrently when inputs is not given,
+    since batch callers already generate bundles on their own thread pool.
+
+    Returns: (success, message, bundle_dict)
+    """
+    paths = artifact_paths(task_id)
+    task = load_json(paths["task_definition"])
+    if not task:
+        return False, f"Task not found: {task_id}", None
+
+    concurrent_hashing = inputs is None
+    if inputs is None:
+        inputs, error = load_bundle_inputs()
+        if inputs is None:
+            return False, error, None
+
+    behaviors = inputs["behaviors"]
+    behavior_files = inputs["behavior_files"]
+    state = inputs["state"]
 
     expanded_behaviors = []
-    context = task.get("context", {})
+    context = dict(task.get("context", {}))
+    task_behaviors = task.get("behaviors", [])
+    task_dependencies = task.get("dependencies") or {}
 
-    for behavior_id in task.get("behaviors", []):
-        behavior_details = find_behavior_by_id(capability_map, behavior_id)
+    for behavior_id in task_behaviors:
+        behavior_details = behaviors.get(behavior_id)
         if behavior_details:
             expanded_behaviors.append({
                 "id": behavior_details["id"],
@@ -368,40 +529,34 @@ def generate_bundle(task_id: str) -> tuple[bool, str, dict | None]:
                 "description": "",
             })
 
-    files = []
-    seen_paths: set[str] = set()
-
-    for file_info in task.get("files", []):
+    # Task files first, then behavior files; the first entry for a path wins.
+    files_by_path: dict[str, dict] = {}
+    for file_info in chain(
+        task.get("files", []),
+        chain.from_iterable(behavior_files.get(b, ()) for b in task_behaviors),
+    ):
         path = file_info.get("path")
-        if path and path not in seen_paths:
-            files.append(file_info)
-            seen_paths.add(path)
-
-    for behavior_id in task.get("behaviors", []):
-        behavior_files = find_files_for_behavior(physical_map, behavior_id)
-        for file_info in behavior_files:
-            path = file_info.get("path")
-            if path and path not in seen_paths:
-                files.append(file_info)
-                seen_paths.add(path)
-
-    task_deps = task.get("dependencies", {}).get("tasks", [])
+        if path and path not in files_by_path:
+            files_by_path[path] = file_info
+    files = list(files_by_path.values())
+
+    task_deps = task_dependencies.get("tasks", [])
     dep_files = find_dependencies_files(state, task_deps)
 
     # Compute artifact checksums for validation
     target_dir = Path(state.get("target_dir", ""))
-    artifact_checksums = {
-        "capability_map": file_checksum(ARTIFACTS_DIR / "capability-map.json"),
-        "physical_map": file_checksum(ARTIFACTS_DIR / "physical-map.json"),
-        "constraints": file_checksum(INPUTS_DIR / "constraints.md"),
-        "task_definition": file_checksum(TASKS_DIR / f"{task_id}.json"),
-    }
-
-    # Compute dependency file checksums
-    dependency_checksums = {}
-    for dep_file in dep_files:
-        full_path = target_dir / dep_file
-        dependency_checksums[dep_file] = file_checksum(full_path)
+    artifact_checksums = {name: file_checksum(path) for name, path in paths.items()}
+
+    # Compute dependency file checksums; hashlib releases the GIL while
+    # hashing, so for a single bundle several files are hashed concurrently
+    if concurrent_hashing and len(dep_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(dep_files), os.cpu_count() or 1)) as pool:
+            checksums = pool.map(lambda dep_file: file_checksum(target_dir / dep_file), dep_files)
+            dependency_checksums = dict(zip(dep_files, checksums))
+    else:
+        dependency_checksums = {
+            dep_file: file_checksum(target_dir / dep_file) for dep_file in dep_files
+        }
 
     bundle = {
         "version": "1.3",  # Version bump for FSM support
@@ -416,10 +571,10 @@ def generate_bundle(task_id: str) -> tuple[bool, str, dict | None]:
         "dependencies": {
             "tasks": task_deps,
             "files": dep_files,
-            "external": task.get("dependencies", {}).get("external", []),
+            "external": task_dependencies.get("external", []),
         },
         "acceptance_criteria": task.get("acceptance_criteria", []),
-        "constraints": parse_constraints(raw_constraints),
+        "constraints": inputs["constraints"],
         "checksums": {
             "artifacts": artifact_checksums,
             "dependency_files": dependency_checksums,
@@ -435,7 +590,7 @@ def generate_bundle(task_id: str) -> tuple[bool, str, dict | None]:
 
     BUNDLES_DIR.mkdir(parents=True, exist_ok=True)
     bundle_path = BUNDLES_DIR / f"{task_id}-bundle.json"
-    bundle_path.write_text(json.dumps(bundle, indent=2))
+    bundle_path.write_bytes(_json_dumps(bundle))
 
     return True, f"Bundle generated: {bundle_path}", bundle
 
@@ -450,16 +605,24 @@ def generate_ready_bundles() -> tuple[int, int]:
     from state import get_ready_tasks
     ready = get_ready_tasks(state)
 
+    # Artifacts are the same for every task; load and parse them once. If one
+    # is missing, generate_bundle retries the load and reports it per task.
+    inputs, _ = load_bundle_inputs(state)
+
     success = 0
     fail = 0
 
-    for task_id in ready:
-        ok, msg, _ = generate_bundle(task_id)
-        print(f"{task_id}: {msg}")
-        if ok:
-            success += 1
-        else:
-            fail += 1
+    # Bundles are independent, so generate them concurrently; checksum
+    # hashing and file I/O release the GIL. Results are reported in ready
+    # order so output stays deterministic.
+    with ThreadPoolExecutor() as pool:
+        results = pool.map(lambda task_id: generate_bundle(task_id, inputs), ready)
+        for task_id, (ok, msg, _) in zip(ready, results):
+            print(f"{task_id}: {msg}")
+            if ok:
+                success += 1
+            else:
+                fail += 1
 
     return success, fail
 
@@ -470,31 +633,50 @@ def validate_bundle(task_id: str) -> tuple[bool, str]:
     if not bundle_path.exists():
         return False, f"Bundle not found: {bundle_path}"
 
+    # The schema rarely changes, so reuse the cached parse between bundles
     schema_path = SCHEMAS_DIR / "execution-bundle.schema.json"
-    if not schema_path.exists():
+    schema = load_json(schema_path)
+    if schema is None:
         return False, f"Schema not found: {schema_path}"
 
-    bundle = json.loads(bundle_path.read_text())
-    schema = json.loads(schema_path.read_text())
+    bundle = _json_loads(bundle_path.read_bytes())
 
     # Full schema validation with jsonschema if available
     try:
-        from jsonschema import ValidationError, validate
+        from jsonschema.exceptions import best_match
 
-        validate(instance=bundle, schema=schema)
+        validator = _bundle_validator(schema_path)
     except ImportError:
         # Fallback to basic validation
         required = schema.get("required", [])
         for field in required:
             if field not in bundle:
                 return False, f"Missing required field: {field}"
-    except ValidationError as e:
-        path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
-        return False, f"Validation error at '{path}': {e.message}"
+    else:
+        e = best_match(validator.iter_errors(bundle))
+        if e is not None:
+            path = " -> ".join([str(p) for p in e.absolute_path]) if e.absolute_path else "root"
+            return False, f"Validation error at '{path}': {e.message}"
 
     return True, "Bundle is valid"
 
 
+def _bundle_validator(schema_path: Path) -> Any:
+    """jsonschema validator for the bundle schema, reused while the schema is unchanged."""
+    st = schema_path.stat()
+    return _build_validator(str(schema_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _build_validator(schema_path: str, mtime_ns: int, size: int) -> Any:
+    from jsonschema.validators import validator_for
+
+    schema = load_json(Path(schema_path))
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
 def validate_bundle_dependencies(task_id: str) -> tuple[bool, list[str]]:
     """Validate that all dependency files referenced in bundle exist.
 
@@ -505,7 +687,7 @@ def validate_bundle_dependencies(task_id: str) -> tuple[bool, list[str]]:
     if not bundle_path.exists():
         return False, [f"Bundle not found: {bundle_path}"]
 
-    bundle = json.loads(bundle_path.read_text())
+    bundle = _json_loads(bundle_path.read_bytes())
     target_dir = Path(bundle.get("target_dir", ""))
     dep_files = bundle.get("dependencies", {}).get("files", [])
 
@@ -540,7 +722,7 @@ def validate_bundle_checksums(task_id: str) -> tuple[bool, list[str]]:
     if not bundle_path.exists():
         return False, [f"Bundle not found: {bundle_path}"]
 
-    bundle = json.loads(bundle_path.read_text())
+    bundle = _json_loads(bundle_path.read_bytes())
     checksums = bundle.get("checksums", {})
 
     if not checksums:
@@ -549,18 +731,17 @@ def validate_bundle_checksums(task_id: str) -> tuple[bool, list[str]]:
 
     changed = []
 
+    # Reuse checksums of files that are unchanged since they were last hashed
+    cache = load_checksum_cache()
+    cached = dict(cache)
+
     # Check artifact checksums
     artifact_checksums = checksums.get("artifacts", {})
-    artifact_paths = {
-        "capability_map": ARTIFACTS_DIR / "capability-map.json",
-        "physical_map": ARTIFACTS_DIR / "physical-map.json",
-        "constraints": INPUTS_DIR / "constraints.md",
-        "task_definition": TASKS_DIR / f"{task_id}.json",
-    }
+    paths = artifact_paths(task_id)
 
     for name, expected in artifact_checksums.items():
-        if name in artifact_paths:
-            current = file_checksum(artifact_paths[name])
+        if name in paths:
+            current = cached_file_checksum(paths[name], cache)
             if expected and current != expected:
                 changed.append(f"Artifact changed: {name} (expected {expected}, got {current})")
 
@@ -570,10 +751,13 @@ def validate_bundle_checksums(task_id: str) -> tuple[bool, list[str]]:
 
     for dep_file, expected in dep_checksums.items():
         full_path = target_dir / dep_file
-        current = file_checksum(full_path)
+        current = cached_file_checksum(full_path, cache)
         if expected and current != expected:
             changed.append(f"Dependency changed: {dep_file} (expected {expected}, got {current})")
 
+    if cache != cached:
+        save_checksum_cache(cache)
+
     return len(changed) == 0, changed
 
 
@@ -591,31 +775,33 @@ def validate_verification_commands(task_id: str) -> tuple[bool, list[str]]:
     if not bundle_path.exists():
         return False, [f"Bundle not found: {bundle_path}"]
 
-    bundle = json.loads(bundle_path.read_text())
+    bundle = _json_loads(bundle_path.read_bytes())
     criteria = bundle.get("acceptance_criteria", [])
 
     # Use centralized validation logic from validate.py
     return validate_verification_commands_for_criteria(criteria)
 
 
+def _bundle_files() -> list[os.DirEntry]:
+    """Bundle files in BUNDLES_DIR, from a single directory read."""
+    try:
+        with os.scandir(BUNDLES_DIR) as it:
+            return [e for e in it if e.name.endswith(BUNDLE_SUFFIX) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
 def list_bundles() -> list[str]:
     """List all existing bundles."""
-    if not BUNDLES_DIR.exists():
-        return []
-    return [p.stem.replace("-bundle", "") for p in BUNDLES_DIR.glob("*-bundle.json")]
+    return [e.name[: -len(BUNDLE_SUFFIX)] for e in _bundle_files()]
 
 
 def clean_bundles() -> int:
     """Remove all bundles. Returns count removed."""
-    if not BUNDLES_DIR.exists():
-        return 0
-
-    count = 0
-    for bundle_file in BUNDLES_DIR.glob("*-bundle.json"):
-        bundle_file.unlink()
-        count += 1
-
-    return count
+    bundle_files = _bundle_files()
+    for entry in bundle_files:
+        os.unlink(entry.path)
+    return len(bundle_files)
 
 
 def main() -> None:
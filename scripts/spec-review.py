@@ -50,7 +50,8 @@ import hashlib
 import json
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal
@@ -59,7 +60,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 
 
-@dataclass
+@dataclass(slots=True)
 class Weakness:
     """Detected spec weakness."""
 
@@ -79,8 +80,20 @@ class Weakness:
     suggested_resolution: str = ""
     behavioral_reframe: str = ""
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "category": self.category,
+            "severity": self.severity,
+            "location": self.location,
+            "description": self.description,
+            "spec_quote": self.spec_quote,
+            "suggested_resolution": self.suggested_resolution,
+            "behavioral_reframe": self.behavioral_reframe,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SpecReview:
     """Complete spec review result."""
 
@@ -92,19 +105,55 @@ class SpecReview:
     summary: dict = field(default_factory=dict)
 
 
+def newline_offsets(content: str) -> list[int]:
+    """Offsets of every newline in content, in ascending order."""
+    offsets = []
+    i = content.find("\n")
+    while i != -1:
+        offsets.append(i)
+        i = content.find("\n", i + 1)
+    return offsets
+
+
+def line_number(newlines: list[int], offset: int) -> int:
+    """1-based line number of offset, given newline_offsets() of the content."""
+    return bisect_left(newlines, offset) + 1
+
+
 # =============================================================================
 # DETECTION: W1 - Non-Behavioral Requirements
 # =============================================================================
 
+# (keyword, pattern, description); the lowercase keyword must appear in any
+# match, so specs without it skip the regex entirely.
 DDL_PATTERNS = [
-    (r"CREATE\s+TABLE", "table definition"),
-    (r"CREATE\s+(UNIQUE\s+)?INDEX", "index definition"),
-    (r"CREATE\s+(OR\s+REPLACE\s+)?FUNCTION", "function definition"),
-    (r"CREATE\s+TRIGGER", "trigger definition"),
-    (r"CONSTRAINT\s+\w+\s+(UNIQUE|CHECK|FOREIGN\s+KEY|PRIMARY\s+KEY)", "constraint"),
-    (r"ALTER\s+TABLE.*ADD\s+CONSTRAINT", "constraint addition"),
+    ("create", re.compile(r"CREATE\s+TABLE", re.IGNORECASE | re.MULTILINE), "table definition"),
+    ("create", re.compile(r"CREATE\s+(UNIQUE\s+)?INDEX", re.IGNORECASE | re.MULTILINE), "index definition"),
+    (
+        "create",
+        re.compile(r"CREATE\s+(OR\s+REPLACE\s+)?FUNCTION", re.IGNORECASE | re.MULTILINE),
+        "function definition",
+    ),
+    ("create", re.compile(r"CREATE\s+TRIGGER", re.IGNORECASE | re.MULTILINE), "trigger definition"),
+    (
+        "constraint",
+        re.compile(
+            r"CONSTRAINT\s+\w+\s+(UNIQUE|CHECK|FOREIGN\s+KEY|PRIMARY\s+KEY)",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        "constraint",
+    ),
+    (
+        "alter",
+        re.compile(r"ALTER\s+TABLE.*ADD\s+CONSTRAINT", re.IGNORECASE | re.MULTILINE),
+        "constraint addition",
+    ),
 ]
 
+STATEMENT_END_RE = re.compile(r"[^;]+;|\)[^)]*\)")
+UNIQUE_COLUMNS_RE = re.compile(r"unique\s*\(([^)]+)\)", re.IGNORECASE)
+CHECK_CONDITION_RE = re.compile(r"check\s*\(([^)]+)\)", re.IGNORECASE)
+
 SCHEMA_PATTERNS = [
     (r'"type"\s*:\s*"(object|array|string|integer)"', "JSON Schema"),
     (r"openapi:\s*['\"]?\d+\.\d+", "OpenAPI spec"),
@@ -116,12 +165,16 @@ def detect_non_behavioral(content: str, lines: list[str]) -> list[Weakness]:
     """Detect DDL and schema definitions that should be behavioral requirements."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
+    content_folded = content.casefold()
 
-    for pattern, desc in DDL_PATTERNS:
-        for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
+    for keyword, pattern, desc in DDL_PATTERNS:
+        if keyword not in content_folded:
+            continue
+        for match in pattern.finditer(content):
             weakness_counter += 1
             start = match.start()
-            line_num = content[:start].count("\n") + 1
+            line_num = line_number(newlines, start)
 
             # Extract context (the full statement)
             context_start = max(0, start - 50)
@@ -129,7 +182,7 @@ def detect_non_behavioral(content: str, lines: list[str]) -> list[Weakness]:
             context = content[context_start:context_end].strip()
 
             # Find end of statement (semicolon or closing paren for constraints)
-            stmt_match = re.search(r"[^;]+;|\)[^)]*\)", context)
+            stmt_match = STATEMENT_END_RE.search(context)
             if stmt_match:
                 quote = stmt_match.group(0)[:150]
             else:
@@ -139,7 +192,7 @@ def detect_non_behavioral(content: str, lines: list[str]) -> list[Weakness]:
                 Weakness(
                     id=f"W1-{weakness_counter:03d}",
                     category="non_behavioral",
-                    severity="critical" if "CONSTRAINT" in pattern else "warning",
+                    severity="critical" if "CONSTRAINT" in pattern.pattern else "warning",
                     location=f"line {line_num}",
                     description=f"DDL {desc} not stated as behavioral requirement",
                     spec_quote=quote.replace("\n", " ").strip(),
@@ -154,12 +207,12 @@ def detect_non_behavioral(content: str, lines: list[str]) -> list[Weakness]:
 def _suggest_behavioral_reframe(desc: str, quote: str) -> str:
     """Suggest behavioral reframing for DDL."""
     if "UNIQUE" in quote.upper():
-        match = re.search(r"unique\s*\(([^)]+)\)", quote, re.IGNORECASE)
+        match = UNIQUE_COLUMNS_RE.search(quote)
         if match:
             cols = match.group(1)
             return f"The system MUST reject duplicate ({cols}) combinations"
     if "CHECK" in quote.upper():
-        match = re.search(r"check\s*\(([^)]+)\)", quote, re.IGNORECASE)
+        match = CHECK_CONDITION_RE.search(quote)
         if match:
             condition = match.group(1)
             return f"The system MUST validate that {condition}"
@@ -174,18 +227,25 @@ def _suggest_behavioral_reframe(desc: str, quote: str) -> str:
 # DETECTION: W2 - Implicit Requirements
 # =============================================================================
 
+NOT_NULL_RE = re.compile(r"(\w+)\s+\w+.*NOT\s+NULL", re.IGNORECASE | re.MULTILINE)
+DEFAULT_VALUE_RE = re.compile(r"(\w+).*DEFAULT\s+([^,\n]+)", re.IGNORECASE | re.MULTILINE)
 
 def detect_implicit(content: str, lines: list[str]) -> list[Weakness]:
     """Detect requirements that are implied but not explicitly stated."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
+    content_folded = content.casefold()
+
+    # Both patterns backtrack over every word in the spec, so only run them
+    # when their keyword appears at all
+    not_null_matches = NOT_NULL_RE.finditer(content) if "null" in content_folded else ()
+    default_matches = DEFAULT_VALUE_RE.finditer(content) if "default" in content_folded else ()
 
     # Pattern: NOT NULL in DDL without corresponding prose
-    for match in re.finditer(
-        r"(\w+)\s+\w+.*NOT\s+NULL", content, re.IGNORECASE | re.MULTILINE
-    ):
+    for match in not_null_matches:
         weakness_counter += 1
-        line_num = content[: match.start()].count("\n") + 1
+        line_num = line_number(newlines, match.start())
         col_name = match.group(1)
 
         weaknesses.append(
@@ -201,11 +261,9 @@ def detect_implicit(content: str, lines: list[str]) -> list[Weakness]:
         )
 
     # Pattern: Default values in DDL
-    for match in re.finditer(
-        r"(\w+).*DEFAULT\s+([^,\n]+)", content, re.IGNORECASE | re.MULTILINE
-    ):
+    for match in default_matches:
         weakness_counter += 1
-        line_num = content[: match.start()].count("\n") + 1
+        line_num = line_number(newlines, match.start())
         col_name = match.group(1)
         default_val = match.group(2).strip()
 
@@ -229,10 +287,13 @@ def detect_implicit(content: str, lines: list[str]) -> list[Weakness]:
 # =============================================================================
 
 CONFIG_TABLE_PATTERNS = [
-    r"\|\s*Variable\s*\|\s*Type\s*\|",  # Markdown table header
-    r"\|\s*`?\w+`?\s*\|\s*(str|int|float|bool)\s*\|",  # Config row
-    r"Environment\s+Variables?",  # Section header
-    r"Configuration\s+(Schema|Variables?)",  # Section header
+    # Markdown table header
+    re.compile(r"\|\s*Variable\s*\|\s*Type\s*\|", re.IGNORECASE | re.MULTILINE),
+    # Config row
+    re.compile(r"\|\s*`?\w+`?\s*\|\s*(str|int|float|bool)\s*\|", re.IGNORECASE | re.MULTILINE),
+    # Section headers
+    re.compile(r"Environment\s+Variables?", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"Configuration\s+(Schema|Variables?)", re.IGNORECASE | re.MULTILINE),
 ]
 
 OBSERVABILITY_PATTERNS = [
@@ -242,11 +303,19 @@ OBSERVABILITY_PATTERNS = [
     r"(p50|p95|p99|latency|histogram|counter|gauge)",
 ]
 
+# One alternation over all observability patterns; group o<i> names the entry.
+# The entries never match overlapping text, so the first hit per group is the
+# same as that pattern's own first match.
+OBSERVABILITY_RE = re.compile(
+    "|".join(f"(?P<o{i}>{pattern})" for i, pattern in enumerate(OBSERVABILITY_PATTERNS)),
+    re.IGNORECASE,
+)
+
 LIFECYCLE_PATTERNS = [
-    r"Startup\s+(Sequence|Tasks?|Order)",
-    r"Shutdown\s+(Sequence|Tasks?|Order)",
-    r"Lifespan|Lifecycle",
-    r"Health\s+Check",
+    re.compile(r"Startup\s+(Sequence|Tasks?|Order)", re.IGNORECASE),
+    re.compile(r"Shutdown\s+(Sequence|Tasks?|Order)", re.IGNORECASE),
+    re.compile(r"Lifespan|Lifecycle", re.IGNORECASE),
+    re.compile(r"Health\s+Check", re.IGNORECASE),
 ]
 
 
@@ -254,12 +323,13 @@ def detect_cross_cutting(content: str, lines: list[str]) -> list[Weakness]:
     """Detect cross-cutting concerns that may not be captured as tasks."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
 
     # Detect config tables
     for pattern in CONFIG_TABLE_PATTERNS:
-        for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
+        for match in pattern.finditer(content):
             weakness_counter += 1
-            line_num = content[: match.start()].count("\n") + 1
+            line_num = line_number(newlines, match.start())
 
             # Extract table context
             context_end = min(len(content), match.end() + 500)
@@ -278,30 +348,40 @@ def detect_cross_cutting(content: str, lines: list[str]) -> list[Weakness]:
             )
             break  # Only flag once per config section
 
-    # Detect observability requirements
-    for pattern in OBSERVABILITY_PATTERNS:
-        for match in re.finditer(pattern, content, re.IGNORECASE):
-            weakness_counter += 1
-            line_num = content[: match.start()].count("\n") + 1
+    # Detect observability requirements (only flag each pattern once)
+    first_matches = [None] * len(OBSERVABILITY_PATTERNS)
+    remaining = len(OBSERVABILITY_PATTERNS)
+    for match in OBSERVABILITY_RE.finditer(content):
+        index = int(match.lastgroup[1:])
+        if first_matches[index] is None:
+            first_matches[index] = match
+            remaining -= 1
+            if not remaining:
+                break
 
-            weaknesses.append(
-                Weakness(
-                    id=f"W3-{weakness_counter:03d}",
-                    category="cross_cutting",
-                    severity="warning",
-                    location=f"line {line_num}",
-                    description="Observability requirement - spans multiple components",
-                    spec_quote=match.group(0),
-                    suggested_resolution="Create dedicated observability task",
-                )
+    for match in first_matches:
+        if match is None:
+            continue
+        weakness_counter += 1
+        line_num = line_number(newlines, match.start())
+
+        weaknesses.append(
+            Weakness(
+                id=f"W3-{weakness_counter:03d}",
+                category="cross_cutting",
+                severity="warning",
+                location=f"line {line_num}",
+                description="Observability requirement - spans multiple components",
+                spec_quote=match.group(0),
+                suggested_resolution="Create dedicated observability task",
             )
-            break  # Only flag once
+        )
 
     # Detect lifecycle requirements
     for pattern in LIFECYCLE_PATTERNS:
-        for match in re.finditer(pattern, content, re.IGNORECASE):
+        for match in pattern.finditer(content):
             weakness_counter += 1
-            line_num = content[: match.start()].count("\n") + 1
+            line_num = line_number(newlines, match.start())
 
             weaknesses.append(
                 Weakness(
@@ -332,16 +412,27 @@ QUALITATIVE_PATTERNS = [
     (r"scalable", "scalability without metric"),
 ]
 
+# One alternation over all qualitative patterns; group q<i> names the entry.
+QUALITATIVE_RE = re.compile(
+    "|".join(f"(?P<q{i}>{pattern})" for i, (pattern, _) in enumerate(QUALITATIVE_PATTERNS)),
+    re.IGNORECASE,
+)
 
 def detect_missing_ac(content: str, lines: list[str]) -> list[Weakness]:
     """Detect requirements that can't be turned into acceptance criteria."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
+
+    # Single scan, bucketed so weaknesses stay grouped in table order
+    matches_by_pattern = [[] for _ in QUALITATIVE_PATTERNS]
+    for match in QUALITATIVE_RE.finditer(content):
+        matches_by_pattern[int(match.lastgroup[1:])].append(match)
 
-    for pattern, desc in QUALITATIVE_PATTERNS:
-        for match in re.finditer(pattern, content, re.IGNORECASE):
+    for (_, desc), matches in zip(QUALITATIVE_PATTERNS, matches_by_pattern):
+        for match in matches:
             weakness_counter += 1
-            line_num = content[: match.start()].count("\n") + 1
+            line_num = line_number(newlines, match.start())
 
             # Get surrounding context
             start = max(0, match.start() - 50)
@@ -367,25 +458,36 @@ def detect_missing_ac(content: str, lines: list[str]) -> list[Weakness]:
 # DETECTION: W5 - Fragmented Requirements
 # =============================================================================
 
+SECTION_REF_PATTERNS = [
+    r"see\s+Section\s+(\d+\.?\d*)",
+    r"as\s+described\s+in\s+Section\s+(\d+\.?\d*)",
+    r"refer\s+to\s+Section\s+(\d+\.?\d*)",
+    r"defined\s+in\s+Section\s+(\d+\.?\d*)",
+]
+
+# One alternation over all reference patterns; group r<i> names the entry and
+# the section number is the group right after it.
+SECTION_REF_RE = re.compile(
+    "|".join(f"(?P<r{i}>{pattern})" for i, pattern in enumerate(SECTION_REF_PATTERNS)),
+    re.IGNORECASE,
+)
 
 def detect_fragmented(content: str, lines: list[str]) -> list[Weakness]:
     """Detect requirements split across multiple sections."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
 
     # Pattern: Cross-references to other sections
-    ref_patterns = [
-        r"see\s+Section\s+(\d+\.?\d*)",
-        r"as\s+described\s+in\s+Section\s+(\d+\.?\d*)",
-        r"refer\s+to\s+Section\s+(\d+\.?\d*)",
-        r"defined\s+in\s+Section\s+(\d+\.?\d*)",
-    ]
+    matches_by_pattern = [[] for _ in SECTION_REF_PATTERNS]
+    for match in SECTION_REF_RE.finditer(content):
+        matches_by_pattern[int(match.lastgroup[1:])].append(match)
 
-    for pattern in ref_patterns:
-        for match in re.finditer(pattern, content, re.IGNORECASE):
+    for matches in matches_by_pattern:
+        for match in matches:
             weakness_counter += 1
-            line_num = content[: match.start()].count("\n") + 1
-            referenced_section = match.group(1)
+            line_num = line_number(newlines, match.start())
+            referenced_section = match.group(match.lastindex + 1)
 
             weaknesses.append(
                 Weakness(
@@ -406,11 +508,15 @@ def detect_fragmented(content: str, lines: list[str]) -> list[Weakness]:
 # DETECTION: W6 - Contradictions
 # =============================================================================
 
+DEFAULT_STATEMENT_RE = re.compile(
+    r"(\w+).*(?:default|defaults?\s+to)\s*[:\s]*[`'\"]?(\w+)[`'\"]?", re.IGNORECASE
+)
 
 def detect_contradictions(content: str, lines: list[str]) -> list[Weakness]:
     """Detect potentially contradictory statements."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
 
     # Pattern: "No X" followed by mention of X as feature
     # This is heuristic - flag for human review
@@ -422,14 +528,10 @@ def detect_contradictions(content: str, lines: list[str]) -> list[Weakness]:
 
     # More sophisticated: Look for conflicting default values
     default_values: dict[str, list[tuple[str, int]]] = {}
-    for match in re.finditer(
-        r"(\w+).*(?:default|defaults?\s+to)\s*[:\s]*[`'\"]?(\w+)[`'\"]?",
-        content,
-        re.IGNORECASE,
-    ):
+    for match in DEFAULT_STATEMENT_RE.finditer(content):
         var_name = match.group(1).lower()
         value = match.group(2)
-        line_num = content[: match.start()].count("\n") + 1
+        line_num = line_number(newlines, match.start())
 
         if var_name not in default_values:
             default_values[var_name] = []
@@ -464,47 +566,47 @@ def detect_contradictions(content: str, lines: list[str]) -> list[Weakness]:
 # Patterns that indicate ambiguity, with clarifying question templates
 AMBIGUITY_PATTERNS = [
     # Vague quantifiers
-    (r"\b(some|many|few|several|various|numerous|multiple)\s+(\w+)", "vague_quantifier",
+    (re.compile(r"\b(some|many|few|several|various|numerous|multiple)\s+(\w+)", re.IGNORECASE), "vague_quantifier",
      "How many {1} specifically? Provide a number or range."),
 
     # Undefined scope
-    (r"\b(etc\.?|and so on|and more|similar\s+\w+|like\s+\w+)\b", "undefined_scope",
+    (re.compile(r"\b(etc\.?|and so on|and more|similar\s+\w+|like\s+\w+)\b", re.IGNORECASE), "undefined_scope",
      "What specifically is included? List all items explicitly."),
 
     # Conditional without criteria
-    (r"\b(if applicable|when appropriate|as needed|when necessary|if required|where possible)\b", "vague_conditional",
+    (re.compile(r"\b(if applicable|when appropriate|as needed|when necessary|if required|where possible)\b", re.IGNORECASE), "vague_conditional",
      "Under what specific conditions does this apply? Define the criteria."),
 
     # Weasel words (weak requirements)
-    (r"\b(may|might|could|possibly|optionally)\s+(be|have|include|support|allow)", "weak_requirement",
+    (re.compile(r"\b(may|might|could|possibly|optionally)\s+(be|have|include|support|allow)", re.IGNORECASE), "weak_requirement",
      "Is this required or optional? If optional, under what conditions?"),
 
     # Passive voice hiding actor
-    (r"\b(is|are|will be|should be|must be)\s+(handled|processed|validated|checked|verified|managed|stored|created|updated|deleted)\b", "passive_actor",
+    (re.compile(r"\b(is|are|will be|should be|must be)\s+(handled|processed|validated|checked|verified|managed|stored|created|updated|deleted)\b", re.IGNORECASE), "passive_actor",
      "What component/system performs this action?"),
 
     # Undefined timing
-    (r"\b(quickly|soon|immediately|eventually|periodically|regularly)\b", "vague_timing",
+    (re.compile(r"\b(quickly|soon|immediately|eventually|periodically|regularly)\b", re.IGNORECASE), "vague_timing",
      "What is the specific timing requirement? (e.g., <100ms, every 5 minutes)"),
 
     # Unspecified behavior
-    (r"\b(properly|correctly|appropriately|adequately|sufficiently)\s+(handle|process|validate|manage)", "vague_behavior",
+    (re.compile(r"\b(properly|correctly|appropriately|adequately|sufficiently)\s+(handle|process|validate|manage)", re.IGNORECASE), "vague_behavior",
      "What does '{0}' mean specifically? Define the expected behavior."),
 
     # Either/or without resolution
-    (r"\b(\w+)\s+or\s+(\w+)\s+(can|may|should|must|will)\b", "unresolved_or",
+    (re.compile(r"\b(\w+)\s+or\s+(\w+)\s+(can|may|should|must|will)\b", re.IGNORECASE), "unresolved_or",
      "Which one: {0} or {1}? Or are both valid? Specify the rule."),
 
     # Reasonable/appropriate without definition
-    (r"\b(reasonable|appropriate|suitable|adequate|sufficient)\s+(\w+)", "subjective_qualifier",
+    (re.compile(r"\b(reasonable|appropriate|suitable|adequate|sufficient)\s+(\w+)", re.IGNORECASE), "subjective_qualifier",
      "What makes a {1} '{0}'? Define the acceptance criteria."),
 
     # References to external knowledge
-    (r"\b(standard|typical|normal|usual|common)\s+(practice|behavior|approach|way)", "external_reference",
+    (re.compile(r"\b(standard|typical|normal|usual|common)\s+(practice|behavior|approach|way)", re.IGNORECASE), "external_reference",
      "Which standard specifically? Document the expected behavior."),
 
     # Unquantified limits
-    (r"\b(large|small|long|short|high|low|fast|slow)\s+(number|amount|size|duration|latency|throughput)", "unquantified_limit",
+    (re.compile(r"\b(large|small|long|short|high|low|fast|slow)\s+(number|amount|size|duration|latency|throughput)", re.IGNORECASE), "unquantified_limit",
      "What specific value constitutes '{0} {1}'? Provide a threshold."),
 ]
 
@@ -513,12 +615,13 @@ def detect_ambiguity(content: str, lines: list[str]) -> list[Weakness]:
     """Detect ambiguous language that requires clarification."""
     weaknesses = []
     weakness_counter = 0
+    newlines = newline_offsets(content)
 
     # Track found ambiguities to avoid duplicates
     found_contexts: set[str] = set()
 
     for pattern, ambiguity_type, question_template in AMBIGUITY_PATTERNS:
-        for match in re.finditer(pattern, content, re.IGNORECASE):
+        for match in pattern.finditer(content):
             # Get context around the match
             start = max(0, match.start() - 100)
             end = min(len(content), match.end() + 100)
@@ -531,7 +634,7 @@ def detect_ambiguity(content: str, lines: list[str]) -> list[Weakness]:
             found_contexts.add(context_key)
 
             weakness_counter += 1
-            line_num = content[: match.start()].count("\n") + 1
+            line_num = line_number(newlines, match.start())
             matched_text = match.group(0)
 
             # Generate clarifying question
@@ -579,7 +682,7 @@ def detect_ambiguity(content: str, lines: list[str]) -> list[Weakness]:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ChecklistItem:
     """Single checklist verification item."""
 
@@ -590,6 +693,16 @@ class ChecklistItem:
     evidence: str = ""
     severity_if_missing: Literal["critical", "warning", "info"] = "warning"
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "category": self.category,
+            "question": self.question,
+            "status": self.status,
+            "evidence": self.evidence,
+            "severity_if_missing": self.severity_if_missing,
+        }
+
 
 CHECKLIST_DEFINITIONS = [
     # C1: Structural Completeness
@@ -643,6 +756,14 @@ CHECKLIST_DEFINITIONS = [
 ]
 
 
+TABLE_DDL_RE = re.compile(r"CREATE\s+TABLE", re.IGNORECASE)
+ENTITY_DESC_RE = re.compile(r"(entity|table|model)\s*:")
+TYPED_FIELD_ROW_RE = re.compile(r"\|\s*\w+\s*\|\s*(str|int|bool|float|uuid|timestamp)")
+ENDPOINT_RE = re.compile(r"(GET|POST|PUT|PATCH|DELETE)\s+/")
+ERROR_CODE_RE = re.compile(r"error.*code|error.*message|\d{3}\s")
+ENV_VAR_RE = re.compile(r"[A-Z][A-Z0-9_]{3,}")
+
+
 def verify_checklist(content: str) -> list[ChecklistItem]:
     """Verify spec against completeness checklist."""
     items: list[ChecklistItem] = []
@@ -716,18 +837,15 @@ def _check_structure(item: ChecklistItem, content: str, content_lower: str) -> C
 
 def _check_data_model(item: ChecklistItem, content: str, content_lower: str) -> ChecklistItem:
     """Check data model completeness items."""
-    has_tables = bool(re.search(r"CREATE\s+TABLE", content, re.IGNORECASE))
-    has_entity_desc = bool(re.search(r"(entity|table|model)\s*:", content_lower))
-
     if item.id == "C2.1":
-        if has_tables or has_entity_desc:
+        if TABLE_DDL_RE.search(content) or ENTITY_DESC_RE.search(content_lower):
             item.status = "complete"
             item.evidence = "Found table/entity definitions"
     elif item.id == "C2.2":
-        if has_tables:
+        if TABLE_DDL_RE.search(content):
             item.status = "complete"
             item.evidence = "Found typed field definitions in DDL"
-        elif re.search(r"\|\s*\w+\s*\|\s*(str|int|bool|float|uuid|timestamp)", content_lower):
+        elif TYPED_FIELD_ROW_RE.search(content_lower):
             item.status = "complete"
             item.evidence = "Found typed fields in table"
     elif item.id == "C2.3":
@@ -736,7 +854,8 @@ def _check_data_model(item: ChecklistItem, content: str, content_lower: str) ->
             item.evidence = "Found required/optional field indicators"
     elif item.id == "C2.4":
         constraints = ["UNIQUE", "CHECK", "FOREIGN KEY", "CONSTRAINT", "PRIMARY KEY"]
-        found = [c for c in constraints if c in content.upper()]
+        content_upper = content.upper()
+        found = [c for c in constraints if c in content_upper]
         if found:
             item.status = "complete"
             item.evidence = f"Found constraints: {', '.join(found)}"
@@ -753,7 +872,7 @@ def _check_data_model(item: ChecklistItem, content: str, content_lower: str) ->
 
 def _check_api(item: ChecklistItem, content: str, content_lower: str) -> ChecklistItem:
     """Check API completeness items."""
-    has_endpoints = bool(re.search(r"(GET|POST|PUT|PATCH|DELETE)\s+/", content))
+    has_endpoints = bool(ENDPOINT_RE.search(content))
 
     if item.id == "C3.1":
         if has_endpoints:
@@ -822,7 +941,7 @@ def _check_errors(item: ChecklistItem, content: str, content_lower: str) -> Chec
             item.status = "complete"
             item.evidence = "Found error condition descriptions"
     elif item.id == "C5.2":
-        if re.search(r"error.*code|error.*message|\d{3}\s", content_lower):
+        if ERROR_CODE_RE.search(content_lower):
             item.status = "complete"
             item.evidence = "Found error codes/messages"
     elif item.id == "C5.3":
@@ -834,7 +953,7 @@ def _check_errors(item: ChecklistItem, content: str, content_lower: str) -> Chec
 
 def _check_config(item: ChecklistItem, content: str, content_lower: str) -> ChecklistItem:
     """Check configuration completeness items."""
-    has_env_vars = bool(re.search(r"[A-Z][A-Z0-9_]{3,}", content))
+    has_env_vars = bool(ENV_VAR_RE.search(content))
 
     if item.id == "C6.1":
         if "environment" in content_lower or has_env_vars:
@@ -1014,7 +1133,7 @@ def analyze_spec(spec_path: Path) -> SpecReview:
         "by_category": by_category,
         "blocking": by_severity["critical"] > 0,
         "checklist": checklist_summary,
-        "checklist_items": [asdict(i) for i in checklist_items],
+        "checklist_items": [i.to_dict() for i in checklist_items],
     }
 
     return review
@@ -1034,7 +1153,7 @@ def save_review(review: SpecReview, planning_dir: Path) -> Path:
         "analyzed_at": review.analyzed_at,
         "status": review.status,
         "summary": review.summary,  # Now includes checklist and checklist_items
-        "weaknesses": [asdict(w) for w in review.weaknesses],
+        "weaknesses": [w.to_dict() for w in review.weaknesses],
     }
 
     output_path.write_text(json.dumps(data, indent=2))
@@ -1086,39 +1205,40 @@ def load_resolutions(planning_dir: Path) -> list[dict]:
 
 def print_report(review: SpecReview) -> None:
     """Print human-readable weakness report."""
-    print("=" * 60)
-    print("SPEC REVIEW REPORT")
-    print("=" * 60)
-    print()
-    print(f"Checksum: {review.spec_checksum}")
-    print(f"Analyzed: {review.analyzed_at}")
-    print()
+    lines: list[str] = []
+    lines.append("=" * 60)
+    lines.append("SPEC REVIEW REPORT")
+    lines.append("=" * 60)
+    lines.append("")
+    lines.append(f"Checksum: {review.spec_checksum}")
+    lines.append(f"Analyzed: {review.analyzed_at}")
+    lines.append("")
 
     # Checklist summary
     checklist = review.summary.get("checklist", {})
     if checklist:
-        print("CHECKLIST VERIFICATION")
-        print("-" * 40)
-        print(f"  Complete: {checklist.get('complete', 0)}")
-        print(f"  Partial:  {checklist.get('partial', 0)}")
-        print(f"  Missing:  {checklist.get('missing', 0)} ({checklist.get('critical_missing', 0)} critical)")
-        print(f"  N/A:      {checklist.get('na', 0)}")
-        print()
+        lines.append("CHECKLIST VERIFICATION")
+        lines.append("-" * 40)
+        lines.append(f"  Complete: {checklist.get('complete', 0)}")
+        lines.append(f"  Partial:  {checklist.get('partial', 0)}")
+        lines.append(f"  Missing:  {checklist.get('missing', 0)} ({checklist.get('critical_missing', 0)} critical)")
+        lines.append(f"  N/A:      {checklist.get('na', 0)}")
+        lines.append("")
 
     # Weakness summary
-    print("WEAKNESS DETECTION")
-    print("-" * 40)
-    print(f"Total Weaknesses: {review.summary['total']}")
-    print(f"  Critical: {review.summary['by_severity']['critical']}")
-    print(f"  Warning:  {review.summary['by_severity']['warning']}")
-    print(f"  Info:     {review.summary['by_severity']['info']}")
-    print()
+    lines.append("WEAKNESS DETECTION")
+    lines.append("-" * 40)
+    lines.append(f"Total Weaknesses: {review.summary['total']}")
+    lines.append(f"  Critical: {review.summary['by_severity']['critical']}")
+    lines.append(f"  Warning:  {review.summary['by_severity']['warning']}")
+    lines.append(f"  Info:     {review.summary['by_severity']['info']}")
+    lines.append("")
 
     if review.summary["blocking"]:
-        print("STATUS: BLOCKED - Critical weaknesses require resolution")
+        lines.append("STATUS: BLOCKED - Critical weaknesses require resolution")
     else:
-        print("STATUS: READY - No blocking weaknesses")
-    print()
+        lines.append("STATUS: READY - No blocking weaknesses")
+    lines.append("")
 
     # Group by category
     by_cat: dict[str, list[Weakness]] = {}
@@ -1142,23 +1262,25 @@ def print_report(review: SpecReview) -> None:
         if cat not in by_cat:
             continue
 
-        print("-" * 60)
-        print(name)
-        print("-" * 60)
+        lines.append("-" * 60)
+        lines.append(name)
+        lines.append("-" * 60)
 
         for w in by_cat[cat]:
             severity_icon = {"critical": "!", "warning": "?", "info": "."}[w.severity]
-            print(f"\n[{severity_icon}] {w.id} ({w.location})")
-            print(f"    {w.description}")
+            lines.append(f"\n[{severity_icon}] {w.id} ({w.location})")
+            lines.append(f"    {w.description}")
             if w.spec_quote:
                 quote = w.spec_quote[:80] + "..." if len(w.spec_quote) > 80 else w.spec_quote
-                print(f"    Quote: {quote}")
+                lines.append(f"    Quote: {quote}")
             if w.suggested_resolution:
-                print(f"    Resolution: {w.suggested_resolution}")
+                lines.append(f"    Resolution: {w.suggested_resolution}")
             if w.behavioral_reframe:
-                print(f"    Reframe: {w.behavioral_reframe}")
+                lines.append(f"    Reframe: {w.behavioral_reframe}")
+
+    lines.append("")
 
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -1187,7 +1309,7 @@ def main() -> None:
             "analyzed_at": review.analyzed_at,
             "status": review.status,
             "summary": review.summary,
-            "weaknesses": [asdict(w) for w in review.weaknesses],
+            "weaknesses": [w.to_dict() for w in review.weaknesses],
         }
         print(json.dumps(data, indent=2))
 
@@ -1241,11 +1363,10 @@ def main() -> None:
         total = review_data["summary"]["total"]
         critical = review_data["summary"]["by_severity"]["critical"]
 
+        resolutions = []
         if resolutions_path.exists():
-            resolutions = json.loads(resolutions_path.read_text())
-            resolved_count = len(resolutions.get("resolutions", []))
-        else:
-            resolved_count = 0
+            resolutions = json.loads(resolutions_path.read_text()).get("resolutions", [])
+        resolved_count = len(resolutions)
 
         print(f"Weaknesses: {total} ({critical} critical)")
         print(f"Resolved: {resolved_count}")
@@ -1256,10 +1377,7 @@ def main() -> None:
             w for w in review_data.get("weaknesses", [])
             if w.get("severity") == "critical"
         ]
-        resolved_ids = set()
-        if resolutions_path.exists():
-            resolutions_data = json.loads(resolutions_path.read_text())
-            resolved_ids = {r["weakness_id"] for r in resolutions_data.get("resolutions", [])}
+        resolved_ids = {r["weakness_id"] for r in resolutions}
 
         unresolved_critical = [w for w in critical_weaknesses if w["id"] not in resolved_ids]
 
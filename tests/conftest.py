@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the scripts test suite."""
+
+import sys
+from pathlib import Path
+
+# Add scripts to path for imports, once for the whole session
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -1,15 +1,14 @@
 """Tests for bundle.py - execution bundle generator."""
 
 import json
-import sys
+import os
 from pathlib import Path
 
 import pytest
 
-# Add scripts to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
 from bundle import (
+    build_behavior_files_index,
+    build_behavior_index,
     clean_bundles,
     find_behavior_by_id,
     find_dependencies_files,
@@ -274,6 +273,32 @@ class TestFindBehaviorById:
         assert result is None
 
 
+class TestBehaviorIndexes:
+    """Tests for build_behavior_index and build_behavior_files_index functions."""
+
+    def test_behavior_index_matches_lookup(self, sample_capability_map: dict) -> None:
+        """Test that every indexed behavior matches find_behavior_by_id."""
+        index = build_behavior_index(sample_capability_map)
+
+        assert set(index) == {"B001", "B002", "B003"}
+        for behavior_id, details in index.items():
+            assert details == find_behavior_by_id(sample_capability_map, behavior_id)
+
+    def test_files_index_merges_mappings(self) -> None:
+        """Test that repeated mappings for a behavior are merged in order."""
+        physical_map = {
+            "file_mapping": [
+                {"behavior_id": "B001", "files": [{"path": "a.py"}]},
+                {"behavior_id": "B001", "tests": [{"path": "test_a.py"}]},
+            ]
+        }
+
+        index = build_behavior_files_index(physical_map)
+
+        assert [f["path"] for f in index["B001"]] == ["a.py", "test_a.py"]
+        assert index["B001"][1]["layer"] == "test"
+
+
 class TestFindFilesForBehavior:
     """Tests for find_files_for_behavior function."""
 
@@ -1018,6 +1043,66 @@ class TestValidateBundleChecksums:
         assert valid is False
         assert any("capability_map" in c for c in changed)
 
+    def test_checksums_artifact_changed_after_cached_run(
+        self,
+        temp_planning_dir: Path,
+        sample_task: dict,
+        sample_capability_map: dict,
+        sample_physical_map: dict,
+        sample_state: dict,
+    ) -> None:
+        """Test that cached checksums are not reused once an artifact changes."""
+        (temp_planning_dir / "tasks" / "T001.json").write_text(json.dumps(sample_task))
+        (temp_planning_dir / "artifacts" / "capability-map.json").write_text(
+            json.dumps(sample_capability_map)
+        )
+        (temp_planning_dir / "artifacts" / "physical-map.json").write_text(
+            json.dumps(sample_physical_map)
+        )
+        (temp_planning_dir / "state.json").write_text(json.dumps(sample_state))
+
+        generate_bundle("T001")
+        assert validate_bundle_checksums("T001") == (True, [])
+        assert (temp_planning_dir / "bundles" / ".integrity-cache.json").exists()
+
+        sample_capability_map["version"] = "10.0"
+        (temp_planning_dir / "artifacts" / "capability-map.json").write_text(
+            json.dumps(sample_capability_map)
+        )
+
+        valid, changed = validate_bundle_checksums("T001")
+
+        assert valid is False
+        assert any("capability_map" in c for c in changed)
+
+    def test_checksums_artifact_replaced_with_old_mtime(
+        self,
+        temp_planning_dir: Path,
+        sample_task: dict,
+        sample_capability_map: dict,
+        sample_physical_map: dict,
+        sample_state: dict,
+    ) -> None:
+        """Test that an artifact restored with an older mtime is still checked."""
+        capability_map_path = temp_planning_dir / "artifacts" / "capability-map.json"
+        (temp_planning_dir / "tasks" / "T001.json").write_text(json.dumps(sample_task))
+        capability_map_path.write_text(json.dumps(sample_capability_map))
+        (temp_planning_dir / "artifacts" / "physical-map.json").write_text(
+            json.dumps(sample_physical_map)
+        )
+        (temp_planning_dir / "state.json").write_text(json.dumps(sample_state))
+
+        generate_bundle("T001")
+
+        sample_capability_map["version"] = "2.0"
+        capability_map_path.write_text(json.dumps(sample_capability_map))
+        os.utime(capability_map_path, ns=(0, 0))
+
+        valid, changed = validate_bundle_checksums("T001")
+
+        assert valid is False
+        assert any("capability_map" in c for c in changed)
+
     def test_checksums_old_bundle_format(self, temp_planning_dir: Path) -> None:
         """Test validation of bundle without checksums (old format)."""
         # Create old-format bundle without checksums
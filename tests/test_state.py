@@ -1,15 +1,11 @@
 """Tests for state.py - state management for task decomposition."""
 
 import json
-import sys
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-# Add scripts to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
 from state import (
     FAILURE_CATEGORIES,
     add_event,
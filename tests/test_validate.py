@@ -1,14 +1,10 @@
 """Tests for validate.py - validation module for task decomposition."""
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 
-# Add scripts to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
 from validate import (
     build_dependency_graph,
     compute_calibration_metrics,